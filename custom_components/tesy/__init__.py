@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 
 from .coordinator import TesyCoordinator
 from .const import (
     DOMAIN,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
+    SNAPSHOT_STORAGE_VERSION,
+    DATA_PROBES,
+    PROBE_MAX_AGE,
 )
 
 PLATFORMS: list[Platform] = [
@@ -40,14 +46,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = TesyCoordinator(
         config_data,
         hass,
+        _snapshot_store(hass, entry),
     )
 
-    try:
-        await coordinator.async_validate_input()
-    except ConnectionError as connection_error:
-        raise ConfigEntryAuthFailed from connection_error
-
-    await coordinator.async_config_entry_first_refresh()
+    # The config flow has just read the device, use its payload
+    probe = _pop_probe(hass, entry)
+    if probe is not None:
+        coordinator.async_seed_data(probe)
+    elif await coordinator.async_restore_snapshot():
+        # Entities are created from the last known payload and stay
+        # unavailable until the refresh, which does not hold up startup
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.entry_id}"
+        )
+    else:
+        # The validated payload is the first refresh
+        try:
+            coordinator.async_seed_data(await coordinator.async_validate_input())
+        except ConnectionError as connection_error:
+            await coordinator.async_shutdown()
+            raise ConfigEntryAuthFailed from connection_error
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -61,13 +79,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if coordinator.options_need_reload(entry.options):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Tuning options are applied live, entities stay in place
+    await coordinator.async_apply_options(entry.options)
+
+
+def _pop_probe(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any] | None:
+    """Return the payload the config flow read for an entry, if still fresh."""
+    probes = hass.data.get(DATA_PROBES, {})
+    if entry.unique_id is None or entry.unique_id not in probes:
+        return None
+    read_at, probe = probes.pop(entry.unique_id)
+    if time.monotonic() - read_at > PROBE_MAX_AGE:
+        return None
+    return probe
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict]:
+    """Return the storage of the last known payload of an entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved payload of a deleted entry."""
+    await _snapshot_store(hass, entry).async_remove()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
@@ -104,7 +104,12 @@ async def async_setup_entry(
         ),
     ]
     
-    async_add_entities(binary_sensors)
+    # Only create the binary sensors the device has data for
+    async_add_entities(
+        binary_sensor
+        for binary_sensor in binary_sensors
+        if binary_sensor.is_supported()
+    )
 
 
 class TesyBinarySensor(TesyEntity, BinarySensorEntity):
@@ -112,6 +117,9 @@ class TesyBinarySensor(TesyEntity, BinarySensorEntity):
 
     _attr_has_entity_name = True
     _attr_should_poll = False  # Disable polling, use coordinator updates only
+    _unrecorded_attributes = TesyEntity._unrecorded_attributes | frozenset(
+        {"raw_value", "status_text"}
+    )
 
     def __init__(
         self,
@@ -134,10 +142,12 @@ class TesyBinarySensor(TesyEntity, BinarySensorEntity):
 
 
 class TesyHeatingBinarySensor(TesyBinarySensor):
+    _dependent_fields = frozenset({ATTR_IS_HEATING})
+
     @property
     def is_on(self) -> bool:
         """Return true if the water heater is currently heating."""
-        return self.coordinator.data.get(ATTR_IS_HEATING) == "1"
+        return bool(self.coordinator.snapshot.heating)
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -149,10 +159,12 @@ class TesyHeatingBinarySensor(TesyBinarySensor):
 
 
 class TesyChildLockBinarySensor(TesyBinarySensor):
+    _dependent_fields = frozenset({ATTR_CHILD_LOCK})
+
     @property
     def is_on(self) -> bool:
         """Return true if child lock is enabled."""
-        return self.coordinator.data.get(ATTR_CHILD_LOCK) == "1"
+        return bool(self.coordinator.snapshot.child_lock)
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -164,10 +176,12 @@ class TesyChildLockBinarySensor(TesyBinarySensor):
 
 
 class TesyVacationModeBinarySensor(TesyBinarySensor):
+    _dependent_fields = frozenset({ATTR_VACATION})
+
     @property
     def is_on(self) -> bool:
         """Return true if vacation mode is enabled."""
-        return self.coordinator.data.get(ATTR_VACATION) == "1"
+        return bool(self.coordinator.snapshot.vacation)
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -179,10 +193,12 @@ class TesyVacationModeBinarySensor(TesyBinarySensor):
 
 
 class TesyBoostModeBinarySensor(TesyBinarySensor):
+    _dependent_fields = frozenset({ATTR_BOOST})
+
     @property
     def is_on(self) -> bool:
         """Return true if boost mode is active."""
-        return self.coordinator.data.get(ATTR_BOOST) == "1"
+        return bool(self.coordinator.snapshot.boost)
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -194,10 +210,12 @@ class TesyBoostModeBinarySensor(TesyBinarySensor):
 
 
 class TesyPowerBinarySensor(TesyBinarySensor):
+    _dependent_fields = frozenset({ATTR_POWER})
+
     @property
     def is_on(self) -> bool:
         """Return true if the water heater is powered on."""
-        return self.coordinator.data.get(ATTR_POWER) == "1"
+        return bool(self.coordinator.snapshot.power)
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -211,11 +229,12 @@ class TesyPowerBinarySensor(TesyBinarySensor):
 
 
 class TesyErrorBinarySensor(TesyBinarySensor):
+    _dependent_fields = frozenset({ATTR_ERROR})
+
     @property
     def is_on(self) -> bool:
         """Return true if there's an active error."""
-        error_code = self.coordinator.data.get(ATTR_ERROR, "00")
-        return error_code != "00"
+        return self.coordinator.snapshot.error_active
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -225,5 +244,5 @@ class TesyErrorBinarySensor(TesyBinarySensor):
             "description": "Indicates whether the device has an active error condition",
             "error_code": error_code,
             "error_text": self.coordinator.get_error_text(),
-            "has_error": error_code != "00"
+            "has_error": self.coordinator.snapshot.error_active
         }
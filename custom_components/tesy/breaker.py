@@ -0,0 +1,127 @@
+"""Circuit breaker for unresponsive Tesy devices."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import random
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+STATE_RECOVERING = "recovering"
+
+
+class TesyCircuitBreaker:
+    """Track device health and decide when polling may hit the device.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    polls are skipped until the next probe, which is pushed out with
+    exponential backoff and jitter. A successful probe starts a ramp that
+    halves the extra polling delay on every success until the configured
+    interval is reached again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        base_backoff: float,
+        max_backoff: float,
+        ramp_steps: int,
+    ) -> None:
+        """Initialize the breaker."""
+        self._failure_threshold = failure_threshold
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._ramp_steps = ramp_steps
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._ramp = 0
+        self._next_probe: datetime | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the breaker state."""
+        return self._state
+
+    @property
+    def backing_off(self) -> bool:
+        """Return True while the breaker is open or probing the device."""
+        return self._state in (STATE_OPEN, STATE_HALF_OPEN)
+
+    @property
+    def next_probe(self) -> datetime | None:
+        """Return when the device is probed next while the breaker is open."""
+        return self._next_probe
+
+    @property
+    def interval_multiplier(self) -> int:
+        """Return the factor applied to the polling interval while ramping up."""
+        return 2**self._ramp
+
+    def allow_request(self) -> bool:
+        """Return True if a poll may be sent to the device now."""
+        if self._state != STATE_OPEN:
+            return True
+        if self._next_probe is not None and dt_util.utcnow() < self._next_probe:
+            return False
+        self._state = STATE_HALF_OPEN
+        _LOGGER.debug("Probing device after backoff")
+        return True
+
+    def seconds_until_probe(self) -> float:
+        """Return the time left before the next probe."""
+        if self._next_probe is None:
+            return 0.0
+        return max(0.0, (self._next_probe - dt_util.utcnow()).total_seconds())
+
+    def record_success(self) -> None:
+        """Account for a successful poll."""
+        if self._state in (STATE_HALF_OPEN, STATE_OPEN):
+            _LOGGER.info("Device is responding again, ramping up polling")
+            self._state = STATE_RECOVERING
+            self._ramp = self._ramp_steps
+        elif self._state == STATE_RECOVERING:
+            self._ramp -= 1
+        if self._ramp <= 0:
+            self._ramp = 0
+            self._state = STATE_CLOSED
+        self._failures = 0
+        self._next_probe = None
+
+    def record_failure(self) -> None:
+        """Account for a failed poll and open the breaker if needed."""
+        self._failures += 1
+        if self._failures < self._failure_threshold and self._state != STATE_HALF_OPEN:
+            return
+
+        exponent = max(0, self._failures - self._failure_threshold)
+        backoff = min(self._max_backoff, self._base_backoff * 2**exponent)
+        # Jitter keeps a fleet of heaters from being probed in lockstep
+        backoff *= random.uniform(0.8, 1.2)
+        if self.backing_off:
+            _LOGGER.debug("Probe failed, backing off for %.0f s", backoff)
+        else:
+            _LOGGER.warning(
+                "Device unresponsive after %s failures, backing off for %.0f s",
+                self._failures,
+                backoff,
+            )
+        self._state = STATE_OPEN
+        self._ramp = 0
+        self._next_probe = dt_util.utcnow() + timedelta(seconds=backoff)
+
+    @property
+    def attributes(self) -> dict[str, str | int | None]:
+        """Return the breaker state for entity attributes."""
+        return {
+            "breaker_state": self._state,
+            "consecutive_failures": self._failures,
+            "next_probe": (
+                self._next_probe.isoformat() if self._next_probe is not None else None
+            ),
+        }
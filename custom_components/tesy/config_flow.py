@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -24,6 +25,18 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
     MIN_UPDATE_INTERVAL,
     MAX_UPDATE_INTERVAL,
+    CONF_KEEP_ALIVE,
+    CONF_MAX_CONNECTIONS,
+    DEFAULT_KEEP_ALIVE,
+    DEFAULT_MAX_CONNECTIONS,
+    MAX_CONNECTIONS,
+    CONF_REQUESTS_PER_MINUTE,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    MIN_REQUESTS_PER_MINUTE,
+    MAX_REQUESTS_PER_MINUTE,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    DATA_PROBES,
 )
 from .coordinator import TesyCoordinator
 
@@ -43,6 +56,16 @@ OPTIONS_SCHEMA = vol.Schema(
             CONF_UPDATE_INTERVAL,
             default=DEFAULT_UPDATE_INTERVAL
         ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
+        vol.Required(CONF_KEEP_ALIVE, default=DEFAULT_KEEP_ALIVE): cv.boolean,
+        vol.Required(
+            CONF_MAX_CONNECTIONS,
+            default=DEFAULT_MAX_CONNECTIONS
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONNECTIONS)),
+        vol.Required(
+            CONF_REQUESTS_PER_MINUTE,
+            default=DEFAULT_REQUESTS_PER_MINUTE
+        ): vol.All(vol.Coerce(int), vol.Range(min=MIN_REQUESTS_PER_MINUTE, max=MAX_REQUESTS_PER_MINUTE)),
+        vol.Required(CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING): cv.boolean,
     }
 )
 
@@ -54,14 +77,17 @@ async def validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any]:
     """
 
     coordinator = TesyCoordinator(data, hass)
-    result = await coordinator.async_validate_input()
+    try:
+        result = await coordinator.async_validate_input()
+    finally:
+        await coordinator.async_shutdown()
 
     title = "Tesy"
 
     if ATTR_DEVICE_ID in result and result[ATTR_DEVICE_ID] in TESY_DEVICE_TYPES:
         title = TESY_DEVICE_TYPES[result[ATTR_DEVICE_ID]]["name"]
 
-    return {"title": title, "unique_id": result[ATTR_MAC]}
+    return {"title": title, "unique_id": result[ATTR_MAC], "payload": result}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -84,6 +110,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(info["unique_id"])
             self._abort_if_unique_id_configured()
 
+            # Hand the payload to the setup of the entry, so it does not read
+            # it again
+            self.hass.data.setdefault(DATA_PROBES, {})[info["unique_id"]] = (
+                time.monotonic(),
+                info["payload"],
+            )
             return self.async_create_entry(title=info["title"], data=user_input)
         except ConnectionError:
             errors["base"] = "cannot_connect"
@@ -115,11 +147,7 @@ class TesyOptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_init(self, user_input=None):
         """Manage the options."""
         if user_input is not None:
-            # Update the coordinator with new settings
-            if DOMAIN in self.hass.data and self.config_entry.entry_id in self.hass.data[DOMAIN]:
-                coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-                coordinator.update_interval_setting(user_input[CONF_UPDATE_INTERVAL])
-
+            # The update listener applies the new settings to the coordinator
             return self.async_create_entry(title="", data=user_input)
 
         current_interval = self.config_entry.options.get(
@@ -127,12 +155,41 @@ class TesyOptionsFlowHandler(config_entries.OptionsFlow):
             self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         )
 
+        current_keep_alive = self.config_entry.options.get(
+            CONF_KEEP_ALIVE, DEFAULT_KEEP_ALIVE
+        )
+        current_max_connections = self.config_entry.options.get(
+            CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS
+        )
+        current_requests_per_minute = self.config_entry.options.get(
+            CONF_REQUESTS_PER_MINUTE, DEFAULT_REQUESTS_PER_MINUTE
+        )
+        current_adaptive_polling = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+
         options_schema = vol.Schema(
             {
                 vol.Required(
                     CONF_UPDATE_INTERVAL,
                     default=current_interval
                 ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
+                vol.Required(
+                    CONF_KEEP_ALIVE,
+                    default=current_keep_alive
+                ): cv.boolean,
+                vol.Required(
+                    CONF_MAX_CONNECTIONS,
+                    default=current_max_connections
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONNECTIONS)),
+                vol.Required(
+                    CONF_REQUESTS_PER_MINUTE,
+                    default=current_requests_per_minute
+                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_REQUESTS_PER_MINUTE, max=MAX_REQUESTS_PER_MINUTE)),
+                vol.Required(
+                    CONF_ADAPTIVE_POLLING,
+                    default=current_adaptive_polling
+                ): cv.boolean,
             }
         )
 
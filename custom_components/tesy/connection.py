@@ -0,0 +1,70 @@
+"""Per-device HTTP connection pool for the Tesy integration."""
+
+from __future__ import annotations
+
+import logging
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TesyConnectionPool:
+    """Own the HTTP connections to a single Tesy ESP32 module.
+
+    The ESP32 only has a handful of sockets, so the pool caps concurrent
+    connections and lets aiohttp reap idle keep-alive connections after
+    ``idle_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        keep_alive: bool,
+        max_connections: int,
+        idle_timeout: float,
+    ) -> None:
+        """Initialize the pool, the session is created lazily."""
+        self._keep_alive = keep_alive
+        self._max_connections = max_connections
+        self._idle_timeout = idle_timeout
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            if self._keep_alive:
+                connector = aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._max_connections,
+                    keepalive_timeout=self._idle_timeout,
+                )
+            else:
+                # Send "Connection: close" and drop the socket after every request
+                connector = aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._max_connections,
+                    force_close=True,
+                )
+            self._session = aiohttp.ClientSession(connector=connector)
+            _LOGGER.debug(
+                "Created connection pool: keep_alive=%s, max_connections=%s, idle_timeout=%s",
+                self._keep_alive,
+                self._max_connections,
+                self._idle_timeout,
+            )
+        return self._session
+
+    async def async_reconfigure(self, keep_alive: bool, max_connections: int) -> None:
+        """Apply new settings, the session is recreated on next use."""
+        if (keep_alive, max_connections) == (self._keep_alive, self._max_connections):
+            return
+        self._keep_alive = keep_alive
+        self._max_connections = max_connections
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the session and every pooled connection."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -9,8 +9,71 @@ DEFAULT_UPDATE_INTERVAL = 60
 MIN_UPDATE_INTERVAL = 30
 MAX_UPDATE_INTERVAL = 300
 
+# Adaptive polling scales the configured interval by heater state
+DEFAULT_ADAPTIVE_POLLING = True
+ADAPTIVE_FAST_FACTOR = 0.5
+ADAPTIVE_SLOW_FACTOR = 3
+
+# Identity, network and schedule entities take the polled payload on a
+# longer cadence
+FULL_REFRESH_INTERVAL = 900
+
+# Last full payload is saved to storage so entities can be created at
+# startup before the device answers
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_INTERVAL = FULL_REFRESH_INTERVAL
+SNAPSHOT_SAVE_DELAY = 10
+
+# Payload read by the config flow, reused by the setup of the new entry
+DATA_PROBES = f"{DOMAIN}_probes"
+PROBE_MAX_AGE = 60
+
+# Old API devstat only carries the device id and MAC address
+DEVSTAT_TTL = 86400
+
+# Circuit breaker for devices that dropped off WiFi
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = 60
+BREAKER_MAX_BACKOFF = 900
+BREAKER_RAMP_STEPS = 3
+
 # Configuration keys
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_KEEP_ALIVE = "keep_alive"
+CONF_MAX_CONNECTIONS = "max_connections"
+CONF_REQUESTS_PER_MINUTE = "requests_per_minute"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+
+# Options that change the entity set and need a reload of the entry, the
+# others are applied to the running coordinator
+RELOAD_OPTIONS: frozenset[str] = frozenset()
+
+# Connection pool settings, the ESP32 has very few sockets to spare
+DEFAULT_KEEP_ALIVE = True
+DEFAULT_MAX_CONNECTIONS = 1
+MAX_CONNECTIONS = 4
+CONNECTION_IDLE_TIMEOUT = 15
+
+# Request budget per device, polls and commands combined
+DEFAULT_REQUESTS_PER_MINUTE = 12
+MIN_REQUESTS_PER_MINUTE = 2
+MAX_REQUESTS_PER_MINUTE = 60
+
+# Setpoint writes are coalesced, only the last target of a burst is sent
+SETPOINT_DEBOUNCE = 1.0
+SETPOINT_DEBOUNCE_MAX = 5.0
+
+# The ESP32 needs a while to hand a command to the heater's PIC controller,
+# commanded fields are re-read with backoff until the device reports them
+CONFIRM_INITIAL_DELAY = 3.0
+CONFIRM_MAX_ATTEMPTS = 4
+
+# State write filters per sensor family, changes within the deadband and
+# writes closer together than the minimum interval (seconds) are dropped
+UPTIME_WRITE_DEADBAND = 3600
+RSSI_WRITE_DEADBAND = 3
+READY_ETA_WRITE_DEADBAND = 120
+LAST_UPDATE_WRITE_INTERVAL = 300
 
 IP_ADDRESS = CONF_IP_ADDRESS
 HEATER_POWER = "heater_power"
@@ -82,6 +145,11 @@ ATTR_MAX_SHOWERS = "tmpMX"
 
 ATTR_PARAMETERS = "parNF"
 
+# Byte offset and scale of the element powers in parNF, one byte per tank
+PARAMETER_POWER_OFFSET = 19
+PARAMETER_POWER_FACTOR = 20
+PARAMETER_ELEMENTS = 2
+
 # Additional attributes from the new JSON response
 ATTR_TIMEZONE = "tz"
 ATTR_PROFILE = "prfl"
@@ -128,6 +196,10 @@ ATTR_PROGRAM_P3_FRIDAY = "prgP3FR"
 ATTR_PROGRAM_P3_SATURDAY = "prgP3SA"
 ATTR_PROGRAM_P3_SUNDAY = "prgP3SU"
 
+# Capabilities derived from the payload and the model, next to its fields
+CAPABILITY_SHOWERS = "use_showers"
+CAPABILITY_DUAL_TANK = "dual_tank"
+
 # Mode mappings for display
 TESY_MODE_MAPPING = {
     "0": "performance",
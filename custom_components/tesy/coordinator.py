@@ -2,37 +2,209 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
+import asyncio
+import contextlib
+import time
 from datetime import timedelta, datetime, timezone
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, NoReturn
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .breaker import (
+    STATE_OPEN,
+    STATE_RECOVERING,
+    TesyCircuitBreaker,
+)
+from .connection import TesyConnectionPool
+from .governor import TesyRequestGovernor
+from .planner import plan_commands
+from .snapshot import TesySnapshot
 from .tesy import Tesy
 from .tesy_oldapi import TesyOldApi
 from .const import (
     ATTR_API,
+    ATTR_BOOST,
+    ATTR_DEVICE_ID,
+    ATTR_LONG_COUNTER,
+    ATTR_COUNTDOWN,
+    ATTR_IS_HEATING,
+    ATTR_VACATION,
+    ATTR_MODE,
+    ATTR_POWER,
+    ATTR_TARGET_TEMP,
     DOMAIN,
     UPDATE_INTERVAL,
     USE_OLD_API,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
+    CONF_KEEP_ALIVE,
+    CONF_MAX_CONNECTIONS,
+    DEFAULT_KEEP_ALIVE,
+    DEFAULT_MAX_CONNECTIONS,
+    CONNECTION_IDLE_TIMEOUT,
+    CONF_REQUESTS_PER_MINUTE,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    SETPOINT_DEBOUNCE,
+    SETPOINT_DEBOUNCE_MAX,
+    CONFIRM_INITIAL_DELAY,
+    CONFIRM_MAX_ATTEMPTS,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    ADAPTIVE_FAST_FACTOR,
+    ADAPTIVE_SLOW_FACTOR,
+    MIN_UPDATE_INTERVAL,
+    MAX_UPDATE_INTERVAL,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_BASE_BACKOFF,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_RAMP_STEPS,
+    FULL_REFRESH_INTERVAL,
+    RELOAD_OPTIONS,
+    SNAPSHOT_SAVE_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    TESY_DEVICE_TYPES,
+    CAPABILITY_SHOWERS,
+    CAPABILITY_DUAL_TANK,
 )
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class TesyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Tesy Coordinator class."""
+class TesyDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Base class with the data helpers shared by both Tesy coordinators."""
+
+    # Raw fields that changed since listeners were last notified, None if
+    # every listener has to update
+    changed_fields: set[str] | None = None
+    _notified_data: dict[str, Any] | None = None
+    _notified_success: bool | None = None
+    _snapshot: TesySnapshot = TesySnapshot()
+    _snapshot_source: dict[str, Any] | None = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Compute the changed fields before notifying listeners."""
+        data = self.data or {}
+        previous = self._notified_data
+        if previous is None or self._notified_success != self.last_update_success:
+            # Availability changed, every entity has to write its state
+            self.changed_fields = None
+        else:
+            self.changed_fields = {
+                field
+                for field in data.keys() | previous.keys()
+                if data.get(field) != previous.get(field)
+            }
+        self._notified_data = dict(data)
+        self._notified_success = self.last_update_success
+        super().async_update_listeners()
+
+    @abstractmethod
+    def get_config_power(self) -> int:
+        """Return the configured heater power in watts."""
+
+    @property
+    @abstractmethod
+    def capabilities(self) -> frozenset[str]:
+        """Return the fields and model features of the device."""
+
+    @property
+    def snapshot(self) -> TesySnapshot:
+        """Return the typed snapshot of the current data."""
+        # Payloads are replaced, never changed in place
+        if self._snapshot_source is not self.data:
+            self._snapshot = TesySnapshot.from_data(self.data)
+            self._snapshot_source = self.data
+        return self._snapshot
+
+    def get_minutes_to_ready(self) -> int | None:
+        """Get minutes until water is ready based on CDT value."""
+        return self.snapshot.countdown
+
+    def get_ready_eta(self) -> datetime | None:
+        """Calculate the timestamp when water will be ready."""
+        minutes = self.get_minutes_to_ready()
+        if minutes and minutes > 0:
+            return dt_util.utcnow() + timedelta(minutes=minutes)
+        return None
+
+    def get_current_step(self) -> int | None:
+        """Get current shower step for Bellislimo models or temperature for other models."""
+        return _to_step(self.snapshot.current_temp)
+
+    def get_target_step(self) -> int | None:
+        """Get target shower step for Bellislimo models or target temperature for other models."""
+        return _to_step(self.snapshot.target_temp)
+
+    def get_requested_step(self) -> int | None:
+        """Get requested shower step/temperature."""
+        return _to_step(self.snapshot.requested_temp)
+
+    def get_max_step(self) -> int | None:
+        """Get maximum shower step value."""
+        return self.snapshot.max_step
+
+    def get_mode_text(self) -> str:
+        """Convert numeric mode to text representation."""
+        return self.snapshot.mode_text
+
+    def get_device_time(self) -> datetime | None:
+        """Get the device's internal time."""
+        return self.snapshot.device_time
+
+    def is_error_active(self) -> bool:
+        """Check if there's an active error based on error code."""
+        return self.snapshot.error_active
+
+    def get_error_text(self) -> str:
+        """Convert error code to human-readable text."""
+        return self.snapshot.error_text
+
+    def get_wifi_signal_strength(self) -> int | None:
+        """Get WiFi signal strength in dBm."""
+        return self.snapshot.rssi
+
+
+def _to_step(value: float | None) -> int | None:
+    """Return a temperature or shower count as a whole step."""
+    return None if value is None else int(value)
+
+
+class TesyCoordinator(TesyDataCoordinator):
+    """Tesy Coordinator class.
 
-    def __init__(self, data: dict[str, Any], hass: HomeAssistant) -> None:
+    Polls the operational state and owns the client, the request governor
+    and the circuit breaker. Identity, network and schedule data is kept by
+    its slow_coordinator.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        hass: HomeAssistant,
+        store: Store[dict[str, Any]] | None = None,
+    ) -> None:
         """Initialize."""
+        self._pool = TesyConnectionPool(
+            keep_alive=data.get(CONF_KEEP_ALIVE, DEFAULT_KEEP_ALIVE),
+            max_connections=data.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+            idle_timeout=CONNECTION_IDLE_TIMEOUT,
+        )
         if data.get(USE_OLD_API):
-            self._client = TesyOldApi(data)
+            self._client = TesyOldApi(data, self._pool)
         else:
-            self._client = Tesy(data)
+            self._client = Tesy(data, self._pool)
+
+        # Every call to the device goes through the governor
+        self._governor = TesyRequestGovernor(
+            data.get(CONF_REQUESTS_PER_MINUTE, DEFAULT_REQUESTS_PER_MINUTE)
+        )
 
         # Use configurable update interval, fallback to default
         update_interval_seconds = data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
@@ -40,6 +212,40 @@ class TesyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._last_successful_update = None
         self._config_data = data
 
+        # Configured interval, the effective one adapts to the heater state
+        self._base_interval = update_interval_seconds
+        self._adaptive_polling = data.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._polling_reason = "configured"
+        self._breaker = TesyCircuitBreaker(
+            failure_threshold=BREAKER_FAILURE_THRESHOLD,
+            base_backoff=BREAKER_BASE_BACKOFF,
+            max_backoff=BREAKER_MAX_BACKOFF,
+            ramp_steps=BREAKER_RAMP_STEPS,
+        )
+
+        # Pending write shared by every caller of the current burst
+        self._state_write: asyncio.Task[dict[str, Any]] | None = None
+        self._pending_state: dict[str, str] = {}
+        self._state_deadline = 0.0
+        # Wakes the pending write when its deadline moves closer
+        self._state_wakeup = asyncio.Event()
+
+        # Commanded values the device has not reported back yet
+        self._unconfirmed: dict[str, str] = {}
+        self._confirm_task: asyncio.Task[None] | None = None
+        # Restarts the backoff of a running check for new commands
+        self._confirm_restart = asyncio.Event()
+        self._last_polled: dict[str, Any] = {}
+
+        # Fields and features of the device, from the first full payload
+        self._capabilities: frozenset[str] | None = None
+
+        # Last known full payload, used to start without the device
+        self._store = store
+        self._snapshot_saved: float | None = None
+
         super().__init__(
             hass,
             _LOGGER,
@@ -47,29 +253,155 @@ class TesyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=update_interval_seconds),
         )
 
-    def _validate(self) -> None:
-        """Validate using Tesy API."""
-        result = self._client.get_data()
+        self.slow_coordinator = TesySlowCoordinator(hass, self)
+
+    async def async_validate_input(self) -> dict[str, Any]:
+        """Validate Tesy component."""
+        result = await self._governor.async_call(self._client.get_data)
         if result.get(ATTR_API) != "OK":
             raise ConnectionError("API validation failed.")
         return result
 
-    async def async_validate_input(self) -> None:
-        """Validate Tesy component."""
-        return await self.hass.async_add_executor_job(self._validate)
-
     async def _async_update_data(self) -> dict[str, Any]:
         """Get new sensor data for Tesy component."""
+        self._check_breaker()
         try:
-            data = await self.hass.async_add_executor_job(self._get_data)
-            _LOGGER.debug("Fetched data: %s", data)
-            # Track successful update time with timezone info
-            self._last_successful_update = dt_util.utcnow()
-            return data
+            data = await self._async_get_data()
         except Exception as e:
-            _LOGGER.error("Failed to fetch data: %s", e)
-            raise UpdateFailed("Failed to fetch data.")
+            self._handle_fetch_failure(e)
+
+        _LOGGER.debug("Fetched data: %s", data)
+        # Track successful update time with timezone info
+        self._last_successful_update = dt_util.utcnow()
+        self._last_polled = data
+        self._breaker.record_success()
+        self._adapt_update_interval(data)
+        return self._apply_unconfirmed(data)
+
+    async def async_fetch_full_data(self) -> dict[str, Any]:
+        """Return the whole payload for the slow coordinator.
+
+        Every poll reads the whole payload, the one of the last successful
+        poll is reused instead of costing the device another request.
+        """
+        if self.last_update_success and self._last_polled:
+            return self._last_polled
+
+        self._check_breaker()
+        try:
+            data = await self._governor.async_poll(self._client.get_data)
+        except Exception as e:
+            self._handle_fetch_failure(e)
+
+        self._breaker.record_success()
+        self._last_polled = data
+        self._async_save_snapshot(data)
+        return data
+
+    @callback
+    def async_seed_data(self, data: dict[str, Any]) -> None:
+        """Use a full payload read at setup as the first refresh."""
+        self._last_successful_update = dt_util.utcnow()
+        self._last_polled = data
+        self._adapt_update_interval(data)
+        self._async_save_snapshot(data)
+        self.async_set_updated_data(data)
+        self.slow_coordinator.async_set_updated_data(data)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Seed both coordinators with the last saved payload.
+
+        The payload only serves to create the entities and the device, both
+        coordinators stay unsuccessful so the entities are unavailable
+        instead of showing stale values until the device answers.
+        """
+        if self._store is None:
+            return False
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+
+        _LOGGER.debug("Restored last known payload with %s fields", len(stored))
+        for coordinator in (self, self.slow_coordinator):
+            coordinator.data = stored
+            coordinator.last_update_success = False
+        return True
+
+    @callback
+    def _async_save_snapshot(self, data: dict[str, Any]) -> None:
+        """Save a full payload, at most once per SNAPSHOT_SAVE_INTERVAL."""
+        if self._store is None:
+            return
+        now = time.monotonic()
+        if (
+            self._snapshot_saved is not None
+            and now - self._snapshot_saved < SNAPSHOT_SAVE_INTERVAL
+        ):
+            return
+        self._snapshot_saved = now
+        self._store.async_delay_save(lambda: data, SNAPSHOT_SAVE_DELAY)
+
+    def _check_breaker(self) -> None:
+        """Fail fast while the device is backing off."""
+        if not self._breaker.allow_request():
+            # Do not wait for another timeout while the device is backing off
+            self._apply_breaker_interval()
+            raise UpdateFailed(
+                f"Device unresponsive, next probe at {self._breaker.next_probe}"
+            )
+
+    def _handle_fetch_failure(self, error: Exception) -> NoReturn:
+        """Account for a failed fetch and raise UpdateFailed."""
+        # Failed probes of a device that is backing off are expected
+        if self._breaker.backing_off:
+            _LOGGER.debug("Probe failed: %s", error.__cause__ or error)
+        else:
+            _LOGGER.error("Failed to fetch data: %s", error.__cause__ or error)
+        self._breaker.record_failure()
+        self._apply_breaker_interval()
+        if (
+            self._breaker.state == STATE_OPEN
+            and self.slow_coordinator.last_update_success
+        ):
+            # Entities of the slow coordinator would otherwise stay available
+            self.slow_coordinator.last_update_success = False
+            self.slow_coordinator.async_update_listeners()
+        if not self.last_update_success:
+            # Listeners are not notified of repeated failures, the sensors
+            # showing the circuit breaker would miss it opening
+            self.async_update_listeners()
+        raise UpdateFailed("Failed to fetch data.") from error
+
+    def _apply_breaker_interval(self) -> None:
+        """Schedule the next poll for the breaker's next probe."""
+        if self._breaker.state != STATE_OPEN:
+            return
+        interval = max(MIN_UPDATE_INTERVAL, int(self._breaker.seconds_until_probe()))
+        self.update_interval = timedelta(seconds=interval)
+        self._polling_reason = "backoff"
     
+    async def async_shutdown(self) -> None:
+        """Stop polling and release pooled connections to the device."""
+        await super().async_shutdown()
+        if self._state_write is not None:
+            self._state_write.cancel()
+            self._state_write = None
+        if self._confirm_task is not None:
+            self._confirm_task.cancel()
+            self._confirm_task = None
+        await self.slow_coordinator.async_shutdown()
+        await self._pool.async_close()
+
+    @property
+    def breaker_attributes(self) -> dict[str, Any]:
+        """Return the circuit breaker state for entity attributes."""
+        return self._breaker.attributes
+
+    @property
+    def request_stats(self) -> dict[str, Any]:
+        """Return queue depth and wait time statistics of the governor."""
+        return self._governor.stats
+
     @property
     def last_successful_update(self) -> datetime | None:
         """Return the timestamp of the last successful update."""
@@ -80,151 +412,333 @@ class TesyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the current update interval in seconds."""
         return int(self.update_interval.total_seconds())
 
+    @property
+    def configured_interval_seconds(self) -> int:
+        """Return the configured update interval in seconds."""
+        return self._base_interval
+
+    @property
+    def polling_reason(self) -> str:
+        """Return why the current update interval was chosen."""
+        return self._polling_reason
+
+    def options_need_reload(self, options: Mapping[str, Any]) -> bool:
+        """Return True if changed options can only be applied by a reload."""
+        return any(
+            options.get(option) != self._config_data.get(option)
+            for option in RELOAD_OPTIONS
+        )
+
+    async def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator and client."""
+        data = {**self._config_data, **options}
+
+        # Swap the connections while no request is in flight
+        await self._governor.async_exclusive(
+            self._pool.async_reconfigure,
+            data.get(CONF_KEEP_ALIVE, DEFAULT_KEEP_ALIVE),
+            data.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+        )
+        self._governor.requests_per_minute = data.get(
+            CONF_REQUESTS_PER_MINUTE, DEFAULT_REQUESTS_PER_MINUTE
+        )
+        self._adaptive_polling = data.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._config_data = data
+        self.update_interval_setting(
+            data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        )
+
     def update_interval_setting(self, new_interval: int) -> None:
         """Update the polling interval."""
+        self._base_interval = new_interval
         self.update_interval = timedelta(seconds=new_interval)
+        self._polling_reason = "configured"
         self._config_data[CONF_UPDATE_INTERVAL] = new_interval
         _LOGGER.info("Update interval changed to %s seconds", new_interval)
+        if self.data:
+            self._adapt_update_interval(self.data)
+        self._apply_breaker_interval()
+
+    def _adapt_update_interval(self, data: dict[str, Any]) -> None:
+        """Poll faster while the heater is busy and slower while it is idle."""
+        interval = self._base_interval
+        if not self._adaptive_polling:
+            self._set_polling_interval(interval, "configured")
+            return
+
+        reason = "idle"
+        try:
+            countdown = int(data.get(ATTR_COUNTDOWN, 0))
+        except (ValueError, TypeError):
+            countdown = 0
+
+        if data.get(ATTR_POWER) == "0":
+            interval = self._base_interval * ADAPTIVE_SLOW_FACTOR
+            reason = "powered off"
+        elif data.get(ATTR_VACATION) == "1":
+            interval = self._base_interval * ADAPTIVE_SLOW_FACTOR
+            reason = "vacation"
+        elif data.get(ATTR_IS_HEATING) == "1":
+            interval = self._base_interval * ADAPTIVE_FAST_FACTOR
+            reason = "heating"
+        elif countdown > 0:
+            interval = self._base_interval * ADAPTIVE_FAST_FACTOR
+            reason = "countdown"
+
+        self._set_polling_interval(interval, reason)
+
+    def _set_polling_interval(self, interval: float, reason: str) -> None:
+        """Apply an update interval, slowed down while recovering from an outage."""
+        if self._breaker.state == STATE_RECOVERING:
+            interval *= self._breaker.interval_multiplier
+            reason = f"recovering ({reason})"
+
+        interval = int(max(MIN_UPDATE_INTERVAL, min(MAX_UPDATE_INTERVAL, interval)))
+        if interval != self.update_interval_seconds:
+            _LOGGER.debug("Polling every %s seconds (%s)", interval, reason)
+            self.update_interval = timedelta(seconds=interval)
+        self._polling_reason = reason
 
     async def async_set_target_temperature(self, val: int) -> dict[str, Any]:
-        """Set target temperature for Tesy component and refresh data."""
-        result = await self.hass.async_add_executor_job(
-            self._client.set_target_temperature, val
-        )
-        # Trigger immediate refresh to get updated state
-        await self.async_request_refresh()
-        return result
+        """Set target temperature for Tesy component."""
+        return await self.async_apply_state(target_temperature=val, debounce=True)
 
     async def async_set_power(self, val: str) -> dict[str, Any]:
-        """Set power for Tesy component and refresh data."""
-        result = await self.hass.async_add_executor_job(self._client.set_power, val)
-        # Trigger immediate refresh to get updated state
-        await self.async_request_refresh()
-        return result
+        """Set power for Tesy component."""
+        return await self.async_apply_state(power=val)
 
     async def async_set_boost(self, val: str) -> dict[str, Any]:
-        """Set boost for Tesy component and refresh data."""
-        result = await self.hass.async_add_executor_job(self._client.set_boost, val)
-        # Trigger immediate refresh to get updated state
-        await self.async_request_refresh()
-        return result
+        """Set boost for Tesy component."""
+        return await self.async_apply_state(boost=val)
 
     async def async_set_operation_mode(self, val: str) -> dict[str, Any]:
-        """Set mode for Tesy component and refresh data."""
-        result = await self.hass.async_add_executor_job(
-            self._client.set_operation_mode, val
+        """Set mode for Tesy component."""
+        return await self.async_apply_state(mode=val)
+
+    async def async_apply_state(
+        self,
+        *,
+        power: str | None = None,
+        mode: str | None = None,
+        target_temperature: int | None = None,
+        boost: str | None = None,
+        debounce: bool = False,
+    ) -> dict[str, Any]:
+        """Move the device to the desired state with as few commands as possible.
+
+        Requests are merged field by field into a pending state, last writer
+        wins. With debounce the write waits until no request arrived for
+        SETPOINT_DEBOUNCE seconds, otherwise it is flushed right away. Every
+        caller of the same write gets its result.
+        """
+        desired = {
+            ATTR_POWER: power,
+            ATTR_MODE: mode,
+            ATTR_TARGET_TEMP: (
+                str(int(target_temperature)) if target_temperature is not None else None
+            ),
+            ATTR_BOOST: boost,
+        }
+        self._pending_state.update(
+            {field: value for field, value in desired.items() if value is not None}
         )
-        # Trigger immediate refresh to get updated state
-        await self.async_request_refresh()
+
+        now = self.hass.loop.time()
+        if debounce:
+            self._state_deadline = max(self._state_deadline, now + SETPOINT_DEBOUNCE)
+        else:
+            self._state_deadline = now
+            self._state_wakeup.set()
+
+        if self._state_write is None:
+            self._state_write = self.hass.async_create_task(self._async_write_state())
+        else:
+            _LOGGER.debug("Merged into pending write: %s", self._pending_state)
+        return await asyncio.shield(self._state_write)
+
+    async def _async_write_state(self) -> dict[str, Any]:
+        """Send the commands for the pending state once the burst has settled."""
+        loop = self.hass.loop
+        hard_deadline = loop.time() + SETPOINT_DEBOUNCE_MAX
+        try:
+            while (now := loop.time()) < (
+                deadline := min(self._state_deadline, hard_deadline)
+            ):
+                self._state_wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(deadline - now):
+                        await self._state_wakeup.wait()
+        finally:
+            # Calls from now on start a new write
+            self._state_write = None
+            desired = self._pending_state
+            self._pending_state = {}
+            self._state_deadline = 0.0
+
+        commands = plan_commands(self.data, desired)
+        _LOGGER.debug("Planned commands for %s: %s", desired, commands)
+        if not commands:
+            return {}
+
+        setters = {
+            ATTR_POWER: self._client.set_power,
+            ATTR_MODE: self._client.set_operation_mode,
+            ATTR_TARGET_TEMP: self._client.set_target_temperature,
+            ATTR_BOOST: self._client.set_boost,
+        }
+        acknowledged: dict[str, str] = {}
+        result: dict[str, Any] = {}
+        try:
+            for field, value in commands:
+                result = await self._governor.async_call(setters[field], value)
+                acknowledged[field] = value
+                if self._echo_confirms(field, value, result):
+                    self._unconfirmed.pop(field, None)
+                else:
+                    self._unconfirmed[field] = value
+        finally:
+            if acknowledged:
+                # Show the new state right away and verify it in the background
+                _LOGGER.debug("Applying acknowledged state: %s", acknowledged)
+                self.async_set_updated_data({**self.data, **acknowledged})
+                if self._unconfirmed:
+                    self._async_start_confirmation()
         return result
 
-    def _get_data(self) -> dict[str, Any]:
+    def _apply_unconfirmed(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Keep commanded values the device has not caught up with yet."""
+        for field, value in list(self._unconfirmed.items()):
+            if str(data.get(field)) == value:
+                _LOGGER.debug("Device confirmed %s=%s", field, value)
+                del self._unconfirmed[field]
+        if not self._unconfirmed:
+            return data
+        return {**data, **self._unconfirmed}
+
+    def _async_start_confirmation(self) -> None:
+        """Start verifying the commanded fields, restarting any running check."""
+        if self._confirm_task is not None:
+            # Never cancel the check, it may be waiting for a shared poll
+            self._confirm_restart.set()
+            return
+        self._confirm_restart.clear()
+        self._confirm_task = self.hass.async_create_task(self._async_confirm_state())
+
+    async def _async_confirm_state(self) -> None:
+        """Poll with backoff until the device reports every commanded field."""
+        delay = CONFIRM_INITIAL_DELAY
+        attempt = 0
+        try:
+            while attempt < CONFIRM_MAX_ATTEMPTS:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(delay):
+                        await self._confirm_restart.wait()
+                if self._confirm_restart.is_set():
+                    # New commands were sent, start over with the short delay
+                    self._confirm_restart.clear()
+                    delay = CONFIRM_INITIAL_DELAY
+                    attempt = 0
+                    continue
+
+                attempt += 1
+                await self.async_refresh()
+                if not self._unconfirmed:
+                    _LOGGER.debug("Device converged after %s attempt(s)", attempt)
+                    return
+                delay *= 2
+        finally:
+            self._confirm_task = None
+
+        _LOGGER.error(
+            "Device did not confirm %s after %s attempts, showing the reported state",
+            self._unconfirmed,
+            CONFIRM_MAX_ATTEMPTS,
+        )
+        self._unconfirmed.clear()
+        if self._last_polled:
+            self.async_set_updated_data({**self.data, **self._last_polled})
+
+    @staticmethod
+    def _echo_confirms(field: str, value: str, result: Any) -> bool:
+        """Return True if the device echoed the commanded value.
+
+        A lagging device may echo the previous value, and the old API and
+        some firmwares only answer with a status, so anything else is
+        verified by polling.
+        """
+        return isinstance(result, dict) and str(result.get(field)) == value
+
+    async def _async_get_data(self) -> dict[str, Any]:
         """Get new sensor data using Tesy API."""
         try:
-            return self._client.get_data()
+            data = await self._governor.async_poll(self._client.get_data)
         except ConnectionError as http_error:
-            _LOGGER.error("Connection error while fetching data: %s", http_error)
+            # Logged by _handle_fetch_failure, quietly while backing off
             raise UpdateFailed from http_error
 
+        # Seed the slow coordinator, or bring it back after an outage instead
+        # of leaving its entities unavailable until its next refresh
+        slow_coordinator = self.slow_coordinator
+        if slow_coordinator.data is None or not slow_coordinator.last_update_success:
+            slow_coordinator.async_set_updated_data(data)
+        self._async_save_snapshot(data)
+        return data
+
     def get_config_power(self) -> int:
+        """Return the configured heater power in watts."""
         return self._client._heater_power
 
-    def get_minutes_to_ready(self) -> int | None:
-        """Get minutes until water is ready based on CDT value."""
-        try:
-            return int(self.data.get("cdt", 0))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid CDT value: %s", self.data.get("cdt"))
-            return None
+    @property
+    def capabilities(self) -> frozenset[str]:
+        """Return the fields and model features of the device."""
+        if self._capabilities is not None:
+            return self._capabilities
 
-    def get_ready_eta(self) -> datetime | None:
-        """Calculate the timestamp when water will be ready."""
-        minutes = self.get_minutes_to_ready()
-        if minutes and minutes > 0:
-            return datetime.now() + timedelta(minutes=minutes)
-        return None
+        data = {**(self.slow_coordinator.data or {}), **(self.data or {})}
+        if not data:
+            return frozenset()
 
-    def get_current_step(self) -> int | None:
-        """Get current shower step for Bellislimo models or temperature for other models."""
-        try:
-            return int(self.data.get("tmpC", 0))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid tmpC value: %s", self.data.get("tmpC"))
-            return None
+        capabilities = set(data)
+        model = TESY_DEVICE_TYPES.get(data.get(ATTR_DEVICE_ID), {})
+        if model.get(CAPABILITY_SHOWERS):
+            capabilities.add(CAPABILITY_SHOWERS)
+        # Double tank devices count seconds for both heaters
+        if ";" in str(data.get(ATTR_LONG_COUNTER, "")):
+            capabilities.add(CAPABILITY_DUAL_TANK)
+        self._capabilities = frozenset(capabilities)
+        _LOGGER.debug("Device capabilities: %s", sorted(self._capabilities))
+        return self._capabilities
 
-    def get_target_step(self) -> int | None:
-        """Get target shower step for Bellislimo models or target temperature for other models."""
-        try:
-            return int(self.data.get("tmpT", 0))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid tmpT value: %s", self.data.get("tmpT"))
-            return None
 
-    def get_requested_step(self) -> int | None:
-        """Get requested shower step/temperature."""
-        try:
-            return int(self.data.get("tmpR", 0))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid tmpR value: %s", self.data.get("tmpR"))
-            return None
+class TesySlowCoordinator(TesyDataCoordinator):
+    """Coordinator for the identity, network and schedule data of a device.
 
-    def get_max_step(self) -> int | None:
-        """Get maximum shower step value."""
-        try:
-            return int(self.data.get("tmpMX", 0))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid tmpMX value: %s", self.data.get("tmpMX"))
-            return None
+    Refreshes the full _all payload on a long cadence through the request
+    governor of the device's TesyCoordinator.
+    """
 
-    def get_mode_text(self) -> str:
-        """Convert numeric mode to text representation."""
-        mode_map = {
-            "0": "performance",
-            "1": "P1",
-            "2": "P2",
-            "3": "P3",  
-            "4": "eco",
-            "5": "EC2",
-            "6": "EC3",
-        }
-        mode = str(self.data.get("mode", "0"))
-        if mode not in mode_map:
-            _LOGGER.warning("Unknown mode value: %s", mode)
-        return mode_map.get(mode, "unknown")
+    def __init__(self, hass: HomeAssistant, coordinator: TesyCoordinator) -> None:
+        """Initialize."""
+        self._coordinator = coordinator
 
-    def get_device_time(self) -> datetime | None:
-        """Get the device's internal time."""
-        try:
-            date_str = self.data.get("date", "")
-            if date_str:
-                # Parse the naive datetime and make it timezone-aware (assuming UTC)
-                naive_dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                return dt_util.as_utc(naive_dt)
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid date value: %s", self.data.get("date"))
-        return None
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} slow",
+            update_interval=timedelta(seconds=FULL_REFRESH_INTERVAL),
+        )
 
-    def is_error_active(self) -> bool:
-        """Check if there's an active error based on error code."""
-        err = self.data.get("err", "00")
-        if err != "00":
-            _LOGGER.info("Active error detected: %s", err)
-        return err != "00"
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Get the full payload for Tesy component."""
+        return await self._coordinator.async_fetch_full_data()
 
-    def get_error_text(self) -> str:
-        """Convert error code to human-readable text."""
-        error_map = {
-            "00": "OK",
-        }
-        code = str(self.data.get("err", "00"))
-        if code not in error_map:
-            _LOGGER.warning("Unknown error code: %s", code)
-        return error_map.get(code, f"Unknown ({code})")
+    def get_config_power(self) -> int:
+        """Return the configured heater power in watts."""
+        return self._coordinator.get_config_power()
 
-    def get_wifi_signal_strength(self) -> int | None:
-        """Get WiFi signal strength in dBm."""
-        try:
-            return int(self.data.get("wdBm", 0))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid wdBm value: %s", self.data.get("wdBm"))
-            return None
+    @property
+    def capabilities(self) -> frozenset[str]:
+        """Return the fields and model features of the device."""
+        return self._coordinator.capabilities
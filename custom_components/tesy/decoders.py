@@ -0,0 +1,70 @@
+"""Cached decoders for the encoded fields of a Tesy payload."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from functools import lru_cache
+import json
+from urllib.parse import unquote
+import logging
+
+from .const import (
+    PARAMETER_ELEMENTS,
+    PARAMETER_POWER_FACTOR,
+    PARAMETER_POWER_OFFSET,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TesyExtra:
+    """Decoded content of the extr field."""
+
+    raw: str
+    decoded: str
+    tzname: str | None
+
+
+@lru_cache(maxsize=16)
+def decode_extra(raw: str) -> TesyExtra | None:
+    """Decode the URL-quoted, base64 encoded JSON of the extr field."""
+    try:
+        decoded = base64.b64decode(unquote(raw)).decode("utf-8")
+        extra_info = json.loads(decoded)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        _LOGGER.debug("Could not decode extr value %s: %s", raw, e)
+        return None
+
+    tzname = extra_info.get("tzname") if isinstance(extra_info, dict) else None
+    return TesyExtra(raw=raw, decoded=decoded, tzname=tzname)
+
+
+@dataclass(frozen=True, slots=True)
+class TesyParameters:
+    """Decoded content of the parNF field."""
+
+    raw: str
+    values: tuple[int, ...]
+    # Power of each heating element in watts, one per tank
+    element_powers: tuple[int, ...]
+
+
+@lru_cache(maxsize=16)
+def decode_parameters(raw: str) -> TesyParameters | None:
+    """Decode the hex encoded parameter bytes of the parNF field."""
+    try:
+        values = tuple(bytes.fromhex(raw))
+    except (ValueError, TypeError) as e:
+        _LOGGER.debug("Could not decode parNF value %s: %s", raw, e)
+        return None
+
+    element_powers = tuple(
+        value * PARAMETER_POWER_FACTOR
+        for value in values[
+            PARAMETER_POWER_OFFSET : PARAMETER_POWER_OFFSET + PARAMETER_ELEMENTS
+        ]
+    )
+    return TesyParameters(raw=raw, values=values, element_powers=element_powers)
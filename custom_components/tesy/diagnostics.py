@@ -0,0 +1,78 @@
+"""Diagnostics support for the Tesy integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_EXTRA,
+    ATTR_MAC,
+    ATTR_PARAMETERS,
+    ATTR_PROFILE,
+    ATTR_WIFI_IP,
+    ATTR_WIFI_SSID,
+    DOMAIN,
+    IP_ADDRESS,
+)
+from .coordinator import TesyCoordinator
+from .decoders import decode_extra, decode_parameters
+
+TO_REDACT = {
+    IP_ADDRESS,
+    ATTR_MAC,
+    ATTR_PROFILE,
+    ATTR_WIFI_IP,
+    ATTR_WIFI_SSID,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: TesyCoordinator = hass.data[DOMAIN][entry.entry_id]
+    slow_coordinator = coordinator.slow_coordinator
+    # The slow coordinator may still hold an older payload
+    data = {**(slow_coordinator.data or {}), **(coordinator.data or {})}
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "payload": async_redact_data(data, TO_REDACT),
+        "decoded": _decode(coordinator, data),
+        "client": {
+            "last_update_success": coordinator.last_update_success,
+            "last_successful_update": coordinator.last_successful_update,
+            "last_full_update_success": slow_coordinator.last_update_success,
+            "update_interval_seconds": coordinator.update_interval_seconds,
+            "configured_interval_seconds": coordinator.configured_interval_seconds,
+            "polling_reason": coordinator.polling_reason,
+            **coordinator.breaker_attributes,
+            **coordinator.request_stats,
+        },
+    }
+
+
+def _decode(coordinator: TesyCoordinator, data: dict[str, Any]) -> dict[str, Any]:
+    """Return the decoded fields of a payload."""
+    decoded: dict[str, Any] = {"snapshot": asdict(coordinator.snapshot)}
+
+    if ATTR_EXTRA in data and (extra := decode_extra(data[ATTR_EXTRA])) is not None:
+        decoded["extra"] = extra.decoded
+    if (
+        ATTR_PARAMETERS in data
+        and (parameters := decode_parameters(data[ATTR_PARAMETERS])) is not None
+    ):
+        decoded["parameters"] = {
+            "values": list(parameters.values),
+            "element_powers": list(parameters.element_powers),
+        }
+
+    return decoded
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -12,33 +12,41 @@ from .const import (
     TESY_DEVICE_TYPES,
     ATTR_DEVICE_ID,
     ATTR_MAC,
-    ATTR_BOOST,
     ATTR_SOFTWARE,
     ATTR_HARDWARE_VERSION,
     ATTR_EXTRA,
     DOMAIN,
     ATTR_API,
 )
-from .coordinator import TesyCoordinator
+from .coordinator import TesyDataCoordinator
+from .decoders import decode_extra
 
 import logging
-import base64
-import json
-from urllib.parse import unquote
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class TesyEntity(CoordinatorEntity[TesyCoordinator]):
+class TesyEntity(CoordinatorEntity[TesyDataCoordinator]):
     """Defines a base Tesy entity."""
 
     _attr_has_entity_name = True
 
+    # Static descriptions are not recorded, subclasses add the attributes
+    # that change on every poll or repeat the state
+    _unrecorded_attributes = frozenset({"description"})
+
+    # Raw fields the entity reads, None if it has to update on every refresh
+    _dependent_fields: frozenset[str] | None = None
+
+    # Capabilities the device must have, besides one of the dependent fields,
+    # for the entity to be created
+    _required_capabilities: frozenset[str] = frozenset()
+
     def __init__(
         self,
         hass: HomeAssistant,
-        coordinator: TesyCoordinator,
+        coordinator: TesyDataCoordinator,
         entry: ConfigEntry,
         description: EntityDescription,
     ) -> None:
@@ -56,6 +64,27 @@ class TesyEntity(CoordinatorEntity[TesyCoordinator]):
             ]
         )
 
+    def is_supported(self) -> bool:
+        """Return True if the device reports what this entity shows."""
+        capabilities = self.coordinator.capabilities
+        if not self._required_capabilities <= capabilities:
+            return False
+        return self._dependent_fields is None or bool(
+            self._dependent_fields & capabilities
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state if a field this entity reads has changed."""
+        changed = self.coordinator.changed_fields
+        if (
+            changed is not None
+            and self._dependent_fields is not None
+            and not changed & self._dependent_fields
+        ):
+            return
+        super()._handle_coordinator_update()
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this Tesy device."""
@@ -68,16 +97,10 @@ class TesyEntity(CoordinatorEntity[TesyCoordinator]):
         # Try to get custom name from extra field
         device_name = device_model
         if ATTR_EXTRA in self.coordinator.data:
-            try:
-                extra_data = self.coordinator.data[ATTR_EXTRA]
-                decoded = unquote(extra_data)
-                json_data = base64.b64decode(decoded).decode('utf-8')
-                extra_info = json.loads(json_data)
-                custom_name = extra_info.get("tzname", device_model)
-                if custom_name and custom_name != "Unknown":
-                    device_name = f"{device_model} ({custom_name})"
-            except:
-                pass  # Use default name if decoding fails
+            extra = decode_extra(self.coordinator.data[ATTR_EXTRA])
+            # Use default name if decoding fails
+            if extra is not None and extra.tzname and extra.tzname != "Unknown":
+                device_name = f"{device_model} ({extra.tzname})"
 
         # Get hardware version if available
         hw_version = self.coordinator.data.get(ATTR_HARDWARE_VERSION, 
@@ -100,19 +123,12 @@ class TesyEntity(CoordinatorEntity[TesyCoordinator]):
     @property
     def is_boost_mode_on(self):
         """Return true if boost mode is on."""
-        if (
-            ATTR_BOOST in self.coordinator.data
-            and self.coordinator.data[ATTR_BOOST] == "1"
-        ):
-            return True
-        return False
+        return bool(self.coordinator.snapshot.boost)
 
     async def async_turn_boost_mode_on(self, **kwargs):
         """Turn on boost mode."""
-        if self.coordinator.data[ATTR_BOOST] == "0":
-            await self.coordinator.async_set_boost("1")
+        await self.coordinator.async_set_boost("1")
 
     async def async_turn_boost_mode_off(self, **kwargs):
         """Turn off boost mode."""
-        if self.coordinator.data[ATTR_BOOST] == "1":
-            await self.coordinator.async_set_boost("0")
+        await self.coordinator.async_set_boost("0")
@@ -0,0 +1,215 @@
+"""Per-device request governor for the Tesy integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+import itertools
+import logging
+import time
+from typing import Any, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+RATE_WINDOW = 60.0
+
+# Lower value is served first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class TesyRequestGovernor:
+    """Serialize all traffic to one device and enforce a request budget.
+
+    The ESP32 firmware locks up when it has to answer concurrent requests,
+    so only one operation is ever in flight and no more than
+    ``requests_per_minute`` operations are started in any 60 s window.
+    Waiting operations are served by priority, so user commands jump ahead
+    of queued background polls.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        """Initialize the governor."""
+        self._requests_per_minute = requests_per_minute
+        self._busy = False
+        self._waiters: list[tuple[int, int, bool, asyncio.Future[None]]] = []
+        self._dispatch_timer: asyncio.TimerHandle | None = None
+        self._sequence = itertools.count()
+        self._pending_polls: dict[Hashable, asyncio.Task[Any]] = {}
+        self._history: deque[float] = deque()
+        self._total_requests = 0
+        self._superseded_polls = 0
+        self._last_wait = 0.0
+        self._max_wait = 0.0
+
+    async def async_call(
+        self,
+        func: Callable[..., Awaitable[_T]],
+        *args: Any,
+        priority: int = PRIORITY_COMMAND,
+    ) -> _T:
+        """Run a client call once the device is idle and the budget allows it."""
+        started = time.monotonic()
+        await self._async_acquire(priority)
+        try:
+            self._record_start(time.monotonic() - started)
+            return await func(*args)
+        finally:
+            self._release()
+
+    async def async_poll(
+        self, func: Callable[[], Awaitable[_T]], key: Hashable = None
+    ) -> _T:
+        """Run a data fetch at background priority.
+
+        A poll that is still queued is shared by every poll with the same
+        key requested after it, so the refresh that follows a command
+        supersedes a scheduled poll instead of costing the device another
+        request. A caller that is cancelled does not cancel the poll for the
+        others.
+        """
+        if (poll := self._pending_polls.get(key)) is not None:
+            self._superseded_polls += 1
+            _LOGGER.debug("Poll %s already queued, sharing its result", key)
+            return await asyncio.shield(poll)
+
+        async def _async_run() -> _T:
+            # Polls requested from now on need a response sent after this one
+            if self._pending_polls.get(key) is poll:
+                del self._pending_polls[key]
+            return await func()
+
+        def _async_done(finished: asyncio.Task[_T]) -> None:
+            if self._pending_polls.get(key) is finished:
+                del self._pending_polls[key]
+            # Mark the exception as retrieved when nobody waited for the poll
+            if not finished.cancelled():
+                finished.exception()
+
+        poll = asyncio.get_running_loop().create_task(
+            self.async_call(_async_run, priority=PRIORITY_POLL)
+        )
+        poll.add_done_callback(_async_done)
+        self._pending_polls[key] = poll
+        return await asyncio.shield(poll)
+
+    async def async_exclusive(
+        self, func: Callable[..., Awaitable[_T]], *args: Any
+    ) -> _T:
+        """Run a local call while no request is in flight, outside the budget."""
+        await self._async_acquire(PRIORITY_COMMAND, budgeted=False)
+        try:
+            return await func(*args)
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int, budgeted: bool = True) -> None:
+        """Wait until this caller owns the device and the budget allows it.
+
+        Callers wait for the budget in the queue, without owning the device,
+        so a throttled poll never holds up a command queued behind it.
+        """
+        if (
+            not self._busy
+            and not self._waiters
+            and (not budgeted or not self._budget_delay())
+        ):
+            self._busy = True
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((priority, next(self._sequence), budgeted, waiter))
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Ownership was handed over just before the cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Give up the device and hand it to the next waiter."""
+        self._busy = False
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand the idle device to the next waiter by priority.
+
+        While the budget is exhausted only calls outside the budget are
+        served, the others get the device once it allows another request.
+        """
+        if self._dispatch_timer is not None:
+            self._dispatch_timer.cancel()
+            self._dispatch_timer = None
+        if self._busy:
+            return
+
+        self._waiters = [entry for entry in self._waiters if not entry[-1].done()]
+        if not self._waiters:
+            return
+
+        delay = self._budget_delay()
+        # Lowest priority value first, then first come first served
+        entry = min(
+            (entry for entry in self._waiters if not delay or not entry[2]),
+            default=None,
+        )
+        if entry is None:
+            _LOGGER.debug("Request budget exhausted, delaying for %.1f s", delay)
+            self._dispatch_timer = asyncio.get_running_loop().call_later(
+                delay, self._dispatch
+            )
+            return
+
+        self._waiters.remove(entry)
+        self._busy = True
+        entry[-1].set_result(None)
+
+    def _budget_delay(self) -> float:
+        """Return the seconds until another request fits in the budget."""
+        now = time.monotonic()
+        while self._history and self._history[0] <= now - RATE_WINDOW:
+            self._history.popleft()
+        if len(self._history) < self._requests_per_minute:
+            return 0.0
+        return self._history[0] + RATE_WINDOW - now
+
+    def _record_start(self, waited: float) -> None:
+        """Account for a request that is about to be sent."""
+        self._history.append(time.monotonic())
+        self._total_requests += 1
+        self._last_wait = waited
+        self._max_wait = max(self._max_wait, waited)
+
+    @property
+    def requests_per_minute(self) -> int:
+        """Return the request budget."""
+        return self._requests_per_minute
+
+    @requests_per_minute.setter
+    def requests_per_minute(self, requests_per_minute: int) -> None:
+        """Change the request budget, waiting calls use it right away."""
+        self._requests_per_minute = requests_per_minute
+        self._dispatch()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of calls waiting for the device."""
+        return sum(1 for *_, waiter in self._waiters if not waiter.done())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return queue and wait time statistics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "requests_per_minute_budget": self._requests_per_minute,
+            "requests_last_minute": len(self._history),
+            "total_requests": self._total_requests,
+            "superseded_polls": self._superseded_polls,
+            "last_wait_seconds": round(self._last_wait, 2),
+            "max_wait_seconds": round(self._max_wait, 2),
+        }
@@ -0,0 +1,41 @@
+"""Minimal-command planner for Tesy control actions."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    ATTR_BOOST,
+    ATTR_MODE,
+    ATTR_POWER,
+    ATTR_TARGET_TEMP,
+)
+
+# Fields that can only be changed while the heater is powered on, in the
+# order the device expects them
+POWERED_FIELDS = (ATTR_MODE, ATTR_TARGET_TEMP, ATTR_BOOST)
+
+
+def plan_commands(
+    current: Mapping[str, Any], desired: Mapping[str, str]
+) -> list[tuple[str, str]]:
+    """Return the (field, value) commands that move current to desired.
+
+    Fields already at their desired value are skipped. Power on is sent
+    before anything else and power off after everything else.
+    """
+    commands: list[tuple[str, str]] = []
+
+    power = desired.get(ATTR_POWER)
+    if power == "1" and str(current.get(ATTR_POWER)) != "1":
+        commands.append((ATTR_POWER, "1"))
+
+    for field in POWERED_FIELDS:
+        if field in desired and str(current.get(field)) != desired[field]:
+            commands.append((field, desired[field]))
+
+    if power == "0" and str(current.get(ATTR_POWER)) != "0":
+        commands.append((ATTR_POWER, "0"))
+
+    return commands
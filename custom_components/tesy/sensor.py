@@ -1,12 +1,10 @@
 """Tesy sensor component."""
 
 from __future__ import annotations
-import base64
-import json
 import logging
-from urllib.parse import unquote
+import time
 from typing import Any
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -17,12 +15,14 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     UnitOfEnergy, 
+    UnitOfPower,
     UnitOfTemperature, 
     UnitOfTime,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     PERCENTAGE,
+    EntityCategory,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
@@ -54,8 +54,19 @@ from .const import (
     ATTR_SOFTWARE,
     ATTR_MAC,
     ATTR_DATE,
+    ATTR_PROFILE,
+    ATTR_WATER_TIMESTAMP,
+    ATTR_PROGRAM_VACATION,
+    ATTR_API,
+    UPTIME_WRITE_DEADBAND,
+    RSSI_WRITE_DEADBAND,
+    READY_ETA_WRITE_DEADBAND,
+    LAST_UPDATE_WRITE_INTERVAL,
+    CAPABILITY_SHOWERS,
+    CAPABILITY_DUAL_TANK,
 )
-from .coordinator import TesyCoordinator
+from .coordinator import TesyDataCoordinator
+from .decoders import decode_extra, decode_parameters
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +79,8 @@ async def async_setup_entry(
     """Initialize Tesy devices from config entry."""
 
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    # Identity, network and schedule data changes rarely
+    slow_coordinator = coordinator.slow_coordinator
     
     sensors = [
         TesyTemperatureSensor(
@@ -100,10 +113,42 @@ async def async_setup_entry(
             0.01,
             None,
         ),
-        TesyRSSISensor(
+        TesyElementPowerSensor(
+            hass,
+            coordinator,
+            entry,
+            SensorEntityDescription(
+                key="element_1_power",
+                name="Element 1 Power",
+                device_class=SensorDeviceClass.POWER,
+                native_unit_of_measurement=UnitOfPower.WATT,
+                icon="mdi:heating-coil",
+                entity_category=EntityCategory.DIAGNOSTIC,
+            ),
+            None,
+            None,
+            element=0,
+        ),
+        TesyElementPowerSensor(
             hass,
             coordinator,
             entry,
+            SensorEntityDescription(
+                key="element_2_power",
+                name="Element 2 Power",
+                device_class=SensorDeviceClass.POWER,
+                native_unit_of_measurement=UnitOfPower.WATT,
+                icon="mdi:heating-coil",
+                entity_category=EntityCategory.DIAGNOSTIC,
+            ),
+            None,
+            None,
+            element=1,
+        ),
+        TesyRSSISensor(
+            hass,
+            slow_coordinator,
+            entry,
             SensorEntityDescription(
                 key="wifi_signal",
                 name="WiFi Signal Strength",
@@ -111,6 +156,7 @@ async def async_setup_entry(
                 state_class=SensorStateClass.MEASUREMENT,
                 native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
                 icon="mdi:wifi",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -126,6 +172,7 @@ async def async_setup_entry(
                 state_class=SensorStateClass.MEASUREMENT,
                 native_unit_of_measurement=UnitOfTime.SECONDS,
                 icon="mdi:clock-outline",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -159,43 +206,46 @@ async def async_setup_entry(
         ),
         TesyHardwareVersionSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="hardware_version",
                 name="Hardware Version",
                 icon="mdi:chip",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
         ),
         TesyWiFiIPSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="wifi_ip",
                 name="WiFi IP Address",
                 icon="mdi:ip-network",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
         ),
         TesyWiFiSSIDSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="wifi_ssid",
                 name="WiFi SSID",
                 icon="mdi:wifi",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
         ),
         TesyDeviceNameSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="device_name",
@@ -207,12 +257,13 @@ async def async_setup_entry(
         ),
         TesyPositionSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="position",
                 name="Installation Position",
                 icon="mdi:rotate-3d-variant",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -294,6 +345,8 @@ async def async_setup_entry(
                 name="Mode Code",
                 state_class=SensorStateClass.MEASUREMENT,
                 icon="mdi:tune-variant",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
@@ -312,13 +365,15 @@ async def async_setup_entry(
         ),
         TesyDeviceTimeSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="device_time",
                 name="Device Time",
                 device_class=SensorDeviceClass.TIMESTAMP,
                 icon="mdi:clock",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
@@ -332,19 +387,22 @@ async def async_setup_entry(
                 name="Warmup Counter",
                 state_class=SensorStateClass.TOTAL,
                 icon="mdi:counter",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
         ),
         TesyMaxStepSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="max_step",
                 name="Max Step",
                 state_class=SensorStateClass.MEASUREMENT,
                 icon="mdi:numeric-4-box-outline",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -363,12 +421,14 @@ async def async_setup_entry(
         ),
         TesyStatusSnapshotSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="status_snapshot",
                 name="Status Snapshot",
                 icon="mdi:file-code-outline",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
@@ -381,42 +441,49 @@ async def async_setup_entry(
                 key="diagnostic",
                 name="Diagnostic Status",
                 icon="mdi:stethoscope",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
         ),
         TesyProfileSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="profile",
                 name="User Profile",
                 icon="mdi:account",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
         ),
         TesyTimestampSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="timestamp",
                 name="Timestamp",
                 icon="mdi:clock",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
             ),
             None,
             None,
         ),
         TesyMaxTemperatureSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="max_temperature",
                 name="Maximum Temperature",
                 icon="mdi:thermometer-high",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -483,12 +550,13 @@ async def async_setup_entry(
         ),
         TesyProgramVacationSensor(
             hass,
-            coordinator,
+            slow_coordinator,
             entry,
             SensorEntityDescription(
                 key="program_vacation",
                 name="Program Vacation",
                 icon="mdi:calendar",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -505,6 +573,7 @@ async def async_setup_entry(
                 state_class=SensorStateClass.MEASUREMENT,
                 native_unit_of_measurement=UnitOfTime.SECONDS,
                 icon="mdi:timer-cog-outline",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
@@ -518,13 +587,15 @@ async def async_setup_entry(
                 name="Last Successful Update",
                 device_class=SensorDeviceClass.TIMESTAMP,
                 icon="mdi:update",
+                entity_category=EntityCategory.DIAGNOSTIC,
             ),
             None,
             None,
         ),
     ]
     
-    async_add_entities(sensors)
+    # Only create the sensors the device has data for
+    async_add_entities(sensor for sensor in sensors if sensor.is_supported())
 
 
 class TesySensor(TesyEntity, SensorEntity):
@@ -533,10 +604,17 @@ class TesySensor(TesyEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False  # Disable polling, use coordinator updates only
 
+    # State write filter, changes within the deadband (state units, seconds
+    # for timestamps) and writes closer together than the minimum interval
+    # are dropped
+    _write_deadband: float | None = None
+    _write_min_interval: float | None = None
+    _last_written: tuple[Any, float] | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
-        coordinator: TesyCoordinator,
+        coordinator: TesyDataCoordinator,
         entry: ConfigEntry,
         description: SensorEntityDescription,
         suggested_precision: float | None,
@@ -568,8 +646,47 @@ class TesySensor(TesyEntity, SensorEntity):
         if options is not None:
             self._attr_options = options
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop updates the write filter considers insignificant."""
+        # Availability changes are always written
+        if self.coordinator.changed_fields is not None and self._is_insignificant():
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember it for the write filter."""
+        if self._write_deadband is not None or self._write_min_interval is not None:
+            self._last_written = (self.native_value, time.monotonic())
+        super().async_write_ha_state()
+
+    def _is_insignificant(self) -> bool:
+        """Return True if the new state is not worth writing."""
+        if self._last_written is None:
+            return False
+        written_value, written_at = self._last_written
+        if (
+            self._write_min_interval is not None
+            and time.monotonic() - written_at < self._write_min_interval
+        ):
+            return True
+        if self._write_deadband is None:
+            return False
+
+        value = self.native_value
+        if isinstance(value, datetime) and isinstance(written_value, datetime):
+            change = abs((value - written_value).total_seconds())
+        elif isinstance(value, (int, float)) and isinstance(written_value, (int, float)):
+            change = abs(value - written_value)
+        else:
+            return value == written_value
+        return change < self._write_deadband
+
 
 class TesyEnergySensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_LONG_COUNTER, ATTR_PARAMETERS})
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
@@ -590,57 +707,84 @@ class TesyEnergySensor(TesySensor):
                 return None
 
             power_dict = self.coordinator.data[ATTR_LONG_COUNTER].split(";")
-            pNF = self.coordinator.data[ATTR_PARAMETERS]
-            watt1 = int(pNF[38 + 0 * 2 : 40 + 0 * 2], 16) * 20
-            watt2 = int(pNF[38 + 1 * 2 : 40 + 1 * 2], 16) * 20
-            tmp_kwh1 = (int(power_dict[0]) * watt1) / (3600.0 * 1000)
-            tmp_kwh2 = (int(power_dict[1]) * watt2) / (3600.0 * 1000)
+            parameters = decode_parameters(self.coordinator.data[ATTR_PARAMETERS])
+            if parameters is None or len(parameters.element_powers) < len(power_dict):
+                return None
+
+            return sum(
+                int(seconds) * watts / (3600.0 * 1000)
+                for seconds, watts in zip(power_dict, parameters.element_powers)
+            )
+
+
+class TesyElementPowerSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_PARAMETERS})
+    _required_capabilities = frozenset({CAPABILITY_DUAL_TANK})
+
+    def __init__(self, *args: Any, element: int) -> None:
+        """Initialize the sensor for one heating element."""
+        super().__init__(*args)
+        self._element = element
+
+    @property
+    def native_value(self):
+        """Return the power of the heating element in watts."""
+        if ATTR_PARAMETERS not in self.coordinator.data:
+            return None
 
-            return tmp_kwh1 + tmp_kwh2
+        parameters = decode_parameters(self.coordinator.data[ATTR_PARAMETERS])
+        if parameters is None or self._element >= len(parameters.element_powers):
+            return None
+        return parameters.element_powers[self._element]
 
 
 class TesyTemperatureSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_CURRENT_TEMP})
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if ATTR_CURRENT_TEMP not in self.coordinator.data:
-            return None
-        return float(self.coordinator.data[ATTR_CURRENT_TEMP])
+        return self.coordinator.snapshot.current_temp
 
 
 class TesyRSSISensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_RSSI})
+    _write_deadband = RSSI_WRITE_DEADBAND
+
     @property
     def native_value(self):
         """Return the WiFi signal strength."""
-        if ATTR_RSSI not in self.coordinator.data:
-            return None
-        return int(self.coordinator.data[ATTR_RSSI])
+        return self.coordinator.snapshot.rssi
 
 
 class TesyUptimeSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_UPTIME})
+    _write_deadband = UPTIME_WRITE_DEADBAND
+
     @property
     def native_value(self):
         """Return the device uptime in seconds."""
-        if ATTR_UPTIME not in self.coordinator.data:
-            return None
-        return int(self.coordinator.data[ATTR_UPTIME])
+        return self.coordinator.snapshot.uptime
 
 
 class TesyCountdownSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_COUNTDOWN})
+    _unrecorded_attributes = TesySensor._unrecorded_attributes | frozenset(
+        {"countdown_minutes", "countdown_seconds"}
+    )
+
     @property
     def native_value(self):
         """Return the countdown timer value in minutes until target temperature is reached."""
-        if ATTR_COUNTDOWN not in self.coordinator.data:
-            return None
-        return int(self.coordinator.data[ATTR_COUNTDOWN])
+        return self.coordinator.snapshot.countdown
 
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return additional attributes for the countdown sensor."""
-        if ATTR_COUNTDOWN not in self.coordinator.data:
+        countdown_minutes = self.coordinator.snapshot.countdown
+        if countdown_minutes is None:
             return None
-        
-        countdown_minutes = int(self.coordinator.data[ATTR_COUNTDOWN])
+
         return {
             "countdown_minutes": countdown_minutes,
             "countdown_seconds": countdown_minutes * 60,
@@ -649,16 +793,20 @@ class TesyCountdownSensor(TesySensor):
 
 
 class TesyErrorSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_ERROR})
+
     @property
     def native_value(self):
         """Return the error code."""
-        if ATTR_ERROR not in self.coordinator.data:
+        snapshot = self.coordinator.snapshot
+        if snapshot.error_code is None:
             return None
-        error_code = self.coordinator.data[ATTR_ERROR]
-        return error_code if error_code != "00" else "No Error"
+        return snapshot.error_code if snapshot.error_active else "No Error"
 
 
 class TesyHardwareVersionSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_HARDWARE_VERSION})
+
     @property
     def native_value(self):
         """Return the hardware version."""
@@ -668,6 +816,8 @@ class TesyHardwareVersionSensor(TesySensor):
 
 
 class TesyWiFiIPSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_WIFI_IP})
+
     @property
     def native_value(self):
         """Return the WiFi IP address."""
@@ -677,6 +827,8 @@ class TesyWiFiIPSensor(TesySensor):
 
 
 class TesyWiFiSSIDSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_WIFI_SSID})
+
     @property
     def native_value(self):
         """Return the WiFi SSID."""
@@ -686,61 +838,47 @@ class TesyWiFiSSIDSensor(TesySensor):
 
 
 class TesyDeviceNameSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_EXTRA})
+    _unrecorded_attributes = TesySensor._unrecorded_attributes | frozenset(
+        {"raw_extra", "decoded_extra"}
+    )
+
     @property
     def native_value(self):
         """Return the custom device name or timezone from extra field."""
         if ATTR_EXTRA not in self.coordinator.data:
             return None
-        
-        try:
-            # Decode the base64 and URL encoded extra field
-            extra_data = self.coordinator.data[ATTR_EXTRA]
-            decoded = unquote(extra_data)
-            json_data = base64.b64decode(decoded).decode('utf-8')
-            extra_info = json.loads(json_data)
-            
-            # Return timezone name if available, otherwise return the device type
-            return extra_info.get("tzname", "Unknown")
-        except (ValueError, json.JSONDecodeError, KeyError, Exception):
-            # If decoding fails, try to parse as simple timezone string
-            try:
-                decoded = unquote(self.coordinator.data[ATTR_EXTRA])
-                json_data = base64.b64decode(decoded).decode('utf-8') 
-                extra_info = json.loads(json_data)
-                return extra_info.get("tzname", "Europe/London")  # Default based on your example
-            except:
-                return "Unknown"
+
+        extra = decode_extra(self.coordinator.data[ATTR_EXTRA])
+        if extra is None or not extra.tzname:
+            return "Unknown"
+        return extra.tzname
 
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return decoded extra information as attributes."""
         if ATTR_EXTRA not in self.coordinator.data:
             return None
-        
-        try:
-            extra_data = self.coordinator.data[ATTR_EXTRA]
-            decoded = unquote(extra_data)
-            json_data = base64.b64decode(decoded).decode('utf-8')
-            extra_info = json.loads(json_data)
-            
-            return {
-                "raw_extra": extra_data,
-                "decoded_extra": json_data,
-                "timezone": extra_info.get("tzname", "Unknown")
-            }
-        except:
-            return {"raw_extra": self.coordinator.data[ATTR_EXTRA]}
+
+        extra_data = self.coordinator.data[ATTR_EXTRA]
+        extra = decode_extra(extra_data)
+        if extra is None:
+            return {"raw_extra": extra_data}
+
+        return {
+            "raw_extra": extra_data,
+            "decoded_extra": extra.decoded,
+            "timezone": extra.tzname or "Unknown"
+        }
 
 
 class TesyPositionSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_POSITION})
+
     @property
     def native_value(self):
         """Return the installation position of the water heater."""
-        if ATTR_POSITION not in self.coordinator.data:
-            return None
-        
-        position_value = self.coordinator.data[ATTR_POSITION]
-        return "Vertical" if position_value == "0" else "Horizontal"
+        return self.coordinator.snapshot.position
     
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
@@ -756,94 +894,77 @@ class TesyPositionSensor(TesySensor):
 
 
 class TesyDiagnosticSensor(TesySensor):
+    """Summary of the API response, the full payload is in the diagnostics."""
+
     @property
     def native_value(self):
         """Return a summary of the API response status."""
         total_fields = len(self.coordinator.data)
         api_status = self.coordinator.data.get("api", "Unknown")
         return f"OK - {total_fields} fields" if api_status == "OK" else f"Error - {api_status}"
-    
-    @property
-    def extra_state_attributes(self) -> dict[str, str] | None:
-        """Return the full API response as attributes for debugging."""
-        # Limit the response to avoid too much data in attributes
-        debug_info = {
-            "total_fields": len(self.coordinator.data),
-            "api_status": self.coordinator.data.get("api", "Unknown"),
-            "device_id": self.coordinator.data.get("id", "Unknown"),
-            "software_version": self.coordinator.data.get("wsw", "Unknown"),
-            "hardware_version": self.coordinator.data.get("hsw", "Unknown"),
-            "mac_address": self.coordinator.data.get("MAC", "Unknown"),
-            "last_update": self.coordinator.data.get("date", "Unknown"),
-        }
-        
-        # Add key operational parameters
-        operational_fields = ["tmpC", "tmpT", "tmpR", "mode", "pwr", "ht", "bst", "err"]
-        for field in operational_fields:
-            if field in self.coordinator.data:
-                debug_info[f"current_{field}"] = self.coordinator.data[field]
-        
-        return debug_info
 
 
 # New sensors from the REST script
 class TesyMinutesToReadySensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_COUNTDOWN})
+
     @property
     def native_value(self):
         """Return the minutes until ready value."""
-        return int(self.coordinator.data.get("cdt", 0))
+        return self.coordinator.get_minutes_to_ready()
 
 
 class TesyReadyETASensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_COUNTDOWN})
+    _write_deadband = READY_ETA_WRITE_DEADBAND
+
     @property
     def native_value(self):
         """Return the estimated timestamp when water will be ready."""
-        minutes_to_ready = int(self.coordinator.data.get("cdt", 0))
-        if minutes_to_ready > 0:
-            return dt_util.utcnow() + timedelta(minutes=minutes_to_ready)
-        return None
+        ready_eta = self.coordinator.get_ready_eta()
+        # The countdown has minute resolution
+        return ready_eta.replace(second=0, microsecond=0) if ready_eta else None
 
 
 class TesyCurrentStepSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_CURRENT_TEMP})
+
     @property
     def native_value(self):
         """Return the current step or temperature value."""
-        return int(self.coordinator.data.get("tmpC", 0))
+        return self.coordinator.get_current_step()
 
 
 class TesyTargetStepSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_TARGET_TEMP})
+
     @property
     def native_value(self):
         """Return the target step or temperature value."""
-        return int(self.coordinator.data.get("tmpT", 0))
+        return self.coordinator.get_target_step()
 
 
 class TesyRequestedStepSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_CURRENT_TARGET_TEMP})
+
     @property
     def native_value(self):
         """Return the requested step or temperature value."""
-        try:
-            tmpR = self.coordinator.data.get("tmpR", None)
-            if tmpR is None:
-                _LOGGER.warning("Requested step (tmpR) is missing in the data.")
-                return None
-
-            requested_step = int(tmpR)
-            _LOGGER.debug("Requested step (tmpR) value: %s", requested_step)
-            return requested_step
-        except (ValueError, TypeError) as e:
-            _LOGGER.error("Invalid tmpR value: %s. Error: %s", self.coordinator.data.get("tmpR"), e)
-            return None
+        return self.coordinator.get_requested_step()
 
 
 class TesyModeCodeSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_MODE})
+
     @property
     def native_value(self):
         """Return the numeric mode code."""
-        return int(self.coordinator.data.get("mode", 0))
+        return self.coordinator.snapshot.mode_number
 
 
 class TesyModeTextSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_MODE})
+
     @property
     def native_value(self):
         """Return the text representation of the mode."""
@@ -852,8 +973,8 @@ class TesyModeTextSensor(TesySensor):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return mode information as attributes."""
-        mode_code = str(self.coordinator.data.get("mode", "0"))
-        
+        mode_code = self.coordinator.snapshot.mode_code or "0"
+
         mode_map = {
             "0": "Performance/Manual mode",
             "1": "Program 1 (P1)",
@@ -871,6 +992,8 @@ class TesyModeTextSensor(TesySensor):
 
 
 class TesyDeviceTimeSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_DATE})
+
     @property
     def native_value(self):
         """Return the device's internal time."""
@@ -878,18 +1001,22 @@ class TesyDeviceTimeSensor(TesySensor):
 
 
 class TesyWarmupCounterSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_UPTIME})
+    _write_deadband = UPTIME_WRITE_DEADBAND
+
     @property
     def native_value(self):
         """Return the device warmup counter."""
-        if "wup" in self.coordinator.data:
-            try:
-                return int(self.coordinator.data["wup"])
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self.coordinator.snapshot.uptime
 
 
 class TesyMaxStepSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_MAX_SHOWERS})
+    _required_capabilities = frozenset({CAPABILITY_SHOWERS})
+    _unrecorded_attributes = TesySensor._unrecorded_attributes | frozenset(
+        {"max_value"}
+    )
+
     @property
     def native_value(self):
         """Return the maximum number of steps/showers."""
@@ -909,6 +1036,8 @@ class TesyMaxStepSensor(TesySensor):
 
 
 class TesyErrorCodeTextSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_ERROR})
+
     @property
     def native_value(self):
         """Return the human-readable error message."""
@@ -917,51 +1046,30 @@ class TesyErrorCodeTextSensor(TesySensor):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return error code details as attributes."""
-        if ATTR_ERROR not in self.coordinator.data:
+        snapshot = self.coordinator.snapshot
+        if snapshot.error_code is None:
             return None
-            
-        error_code = self.coordinator.data[ATTR_ERROR]
+
         return {
-            "raw_code": error_code,
-            "is_error_active": error_code != "00"
+            "raw_code": snapshot.error_code,
+            "is_error_active": snapshot.error_active
         }
 
 
 class TesyStatusSnapshotSensor(TesySensor):
+    """Status of the device payload, the snapshot itself is in the diagnostics."""
+
+    _dependent_fields = frozenset({ATTR_API})
+
     @property
     def native_value(self):
-        """Always return OK for the snapshot sensor."""
-        return "OK"
-    
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return the full snapshot of device state as attributes."""
-        # List of important keys to include in the snapshot
-        key_fields = [
-            'tz', 'wsw', 'prfl', 'extr', 'id', 'date', 'wtstp', 'wup', 'hsw', 'tmpMX', 
-            'reset', 'err', 'tmpT', 'tmpR', 'mode', 'lck', 'bst', 'vac', 'pwr', 'ht', 
-            'psn', 'tmpC', 'cdt', 'PICTime', 'prgVac', 'wIP', 'wSSID', 'wdBm', 'MAC', 'api'
-        ]
-        
-        # Program schedule fields for each day
-        program_fields = []
-        for program in ['prgP1', 'prgP2', 'prgP3']:
-            for day in ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']:
-                program_fields.append(f"{program}{day}")
-                
-        # Combine all fields
-        all_fields = key_fields + program_fields
-        
-        # Create snapshot with available data
-        snapshot = {}
-        for field in all_fields:
-            if field in self.coordinator.data:
-                snapshot[field] = self.coordinator.data[field]
-                
-        return snapshot
+        """Return OK while the device answers the API."""
+        return "OK" if self.coordinator.data.get(ATTR_API) == "OK" else "Error"
 
 
 class TesyProfileSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_PROFILE})
+
     @property
     def native_value(self):
         """Return the user profile."""
@@ -969,6 +1077,8 @@ class TesyProfileSensor(TesySensor):
 
 
 class TesyTimestampSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_WATER_TIMESTAMP})
+
     @property
     def native_value(self):
         """Return the timestamp."""
@@ -976,6 +1086,8 @@ class TesyTimestampSensor(TesySensor):
 
 
 class TesyMaxTemperatureSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_MAX_SHOWERS})
+
     @property
     def native_value(self):
         """Return the maximum temperature."""
@@ -983,46 +1095,53 @@ class TesyMaxTemperatureSensor(TesySensor):
 
 
 class TesyLockStatusSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_CHILD_LOCK})
+
     @property
     def native_value(self):
         """Return the lock status."""
-        lock_status = self.coordinator.data.get("lck", None)
-        return "Locked" if lock_status == "1" else "Unlocked"
+        return "Locked" if self.coordinator.snapshot.child_lock else "Unlocked"
 
 
 class TesyBoostStatusSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_BOOST})
+
     @property
     def native_value(self):
         """Return the boost status."""
-        boost_status = self.coordinator.data.get("bst", None)
-        return "Active" if boost_status == "1" else "Inactive"
+        return "Active" if self.coordinator.snapshot.boost else "Inactive"
 
 
 class TesyVacationModeSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_VACATION})
+
     @property
     def native_value(self):
         """Return the vacation mode status."""
-        vacation_status = self.coordinator.data.get("vac", None)
-        return "Enabled" if vacation_status == "1" else "Disabled"
+        return "Enabled" if self.coordinator.snapshot.vacation else "Disabled"
 
 
 class TesyPowerStatusSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_POWER})
+
     @property
     def native_value(self):
         """Return the power status."""
-        power_status = self.coordinator.data.get("pwr", None)
-        return "On" if power_status == "1" else "Off"
+        return "On" if self.coordinator.snapshot.power else "Off"
 
 
 class TesyHeatingStatusSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_IS_HEATING})
+
     @property
     def native_value(self):
         """Return the heating status."""
-        heating_status = self.coordinator.data.get("ht", None)
-        return "Heating" if heating_status == "1" else "Not Heating"
+        return "Heating" if self.coordinator.snapshot.heating else "Not Heating"
 
 
 class TesyProgramVacationSensor(TesySensor):
+    _dependent_fields = frozenset({ATTR_PROGRAM_VACATION})
+
     @property
     def native_value(self):
         """Return the program vacation data."""
@@ -1030,6 +1149,15 @@ class TesyProgramVacationSensor(TesySensor):
 
 
 class TesyPollingIntervalSensor(TesySensor):
+    _unrecorded_attributes = TesySensor._unrecorded_attributes | frozenset(
+        {"interval_seconds", "interval_minutes", "configurable"}
+    )
+
+    @property
+    def available(self) -> bool:
+        """Stay available to show the backoff while the device is offline."""
+        return True
+
     @property
     def native_value(self):
         """Return the current polling interval in seconds."""
@@ -1041,23 +1169,61 @@ class TesyPollingIntervalSensor(TesySensor):
         return {
             "interval_seconds": self.coordinator.update_interval_seconds,
             "interval_minutes": round(self.coordinator.update_interval_seconds / 60, 1),
+            "configured_interval_seconds": self.coordinator.configured_interval_seconds,
+            "reason": self.coordinator.polling_reason,
             "description": "How often the integration polls the device for updates",
             "configurable": "This can be changed in the integration settings"
         }
 
 
 class TesyLastUpdateSensor(TesySensor):
+    _write_min_interval = LAST_UPDATE_WRITE_INTERVAL
+    _written_breaker: tuple[Any, Any] | None = None
+    _unrecorded_attributes = TesySensor._unrecorded_attributes | frozenset(
+        {
+            "last_update_datetime",
+            "seconds_since_update",
+            "minutes_since_update",
+            "update_interval_seconds",
+        }
+    )
+
+    @property
+    def available(self) -> bool:
+        """Stay available to show the circuit breaker while the device is offline."""
+        return True
+
     @property
     def native_value(self):
         """Return the timestamp of the last successful update."""
         return self.coordinator.last_successful_update
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember the circuit breaker it shows."""
+        self._written_breaker = self._breaker_state()
+        super().async_write_ha_state()
+
+    def _is_insignificant(self) -> bool:
+        """Always write circuit breaker changes, they bypass the interval."""
+        if self._breaker_state() != self._written_breaker:
+            return False
+        return super()._is_insignificant()
+
+    def _breaker_state(self) -> tuple[Any, Any]:
+        """Return the circuit breaker state and consecutive failures."""
+        attributes = self.coordinator.breaker_attributes
+        return attributes["breaker_state"], attributes["consecutive_failures"]
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return last update information as attributes."""
         last_update = self.coordinator.last_successful_update
         if last_update is None:
-            return {"status": "No successful updates yet"}
+            return {
+                "status": "No successful updates yet",
+                **self.coordinator.breaker_attributes,
+            }
         
         now = dt_util.utcnow()
         time_since_update = now - last_update
@@ -1067,5 +1233,6 @@ class TesyLastUpdateSensor(TesySensor):
             "seconds_since_update": int(time_since_update.total_seconds()),
             "minutes_since_update": round(time_since_update.total_seconds() / 60, 1),
             "update_interval_seconds": self.coordinator.update_interval_seconds,
-            "status": "Connected" if time_since_update.total_seconds() < (self.coordinator.update_interval_seconds * 2) else "Delayed"
+            "status": "Connected" if time_since_update.total_seconds() < (self.coordinator.update_interval_seconds * 2) else "Delayed",
+            **self.coordinator.breaker_attributes,
         }
@@ -0,0 +1,169 @@
+"""Typed snapshot of a Tesy device payload."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BOOST,
+    ATTR_CHILD_LOCK,
+    ATTR_COUNTDOWN,
+    ATTR_CURRENT_TARGET_TEMP,
+    ATTR_CURRENT_TEMP,
+    ATTR_DATE,
+    ATTR_ERROR,
+    ATTR_IS_HEATING,
+    ATTR_MAX_SHOWERS,
+    ATTR_MODE,
+    ATTR_POSITION,
+    ATTR_POWER,
+    ATTR_RSSI,
+    ATTR_TARGET_TEMP,
+    ATTR_UPTIME,
+    ATTR_VACATION,
+    TESY_ERROR_CODES,
+    TESY_MODE_MAPPING,
+)
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+POSITION_VERTICAL = "Vertical"
+POSITION_HORIZONTAL = "Horizontal"
+
+
+@dataclass(frozen=True, slots=True)
+class TesySnapshot:
+    """Values of a device payload, converted once per poll.
+
+    Fields missing from the payload or holding invalid values are None.
+    """
+
+    current_temp: float | None = None
+    target_temp: float | None = None
+    requested_temp: float | None = None
+    max_step: int | None = None
+    countdown: int | None = None
+    uptime: int | None = None
+    rssi: int | None = None
+    power: bool | None = None
+    boost: bool | None = None
+    heating: bool | None = None
+    child_lock: bool | None = None
+    vacation: bool | None = None
+    mode_code: str | None = None
+    # Numeric value of the mode code, None if the device sent a non-numeric one
+    mode_number: int | None = None
+    position: str | None = None
+    error_code: str | None = None
+    device_time: datetime | None = None
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any] | None) -> TesySnapshot:
+        """Convert a raw payload into a snapshot."""
+        if not data:
+            return cls()
+
+        mode = data.get(ATTR_MODE)
+        mode_number = None
+        if mode is not None:
+            mode = str(mode)
+            if mode not in TESY_MODE_MAPPING:
+                _LOGGER.warning("Unknown mode value: %s", mode)
+            if mode.isdecimal():
+                mode_number = int(mode)
+
+        position = data.get(ATTR_POSITION)
+        if position is not None:
+            position = (
+                POSITION_VERTICAL if str(position) == "0" else POSITION_HORIZONTAL
+            )
+
+        error = data.get(ATTR_ERROR)
+        if error is not None:
+            error = str(error)
+
+        return cls(
+            current_temp=_to_float(data, ATTR_CURRENT_TEMP),
+            target_temp=_to_float(data, ATTR_TARGET_TEMP),
+            requested_temp=_to_float(data, ATTR_CURRENT_TARGET_TEMP),
+            max_step=_to_int(data, ATTR_MAX_SHOWERS),
+            countdown=_to_int(data, ATTR_COUNTDOWN),
+            uptime=_to_int(data, ATTR_UPTIME),
+            rssi=_to_int(data, ATTR_RSSI),
+            power=_to_bool(data, ATTR_POWER),
+            boost=_to_bool(data, ATTR_BOOST),
+            heating=_to_bool(data, ATTR_IS_HEATING),
+            child_lock=_to_bool(data, ATTR_CHILD_LOCK),
+            vacation=_to_bool(data, ATTR_VACATION),
+            mode_code=mode,
+            mode_number=mode_number,
+            position=position,
+            error_code=error,
+            device_time=_to_datetime(data, ATTR_DATE),
+        )
+
+    @property
+    def mode_text(self) -> str:
+        """Return the text representation of the mode."""
+        return TESY_MODE_MAPPING.get(self.mode_code or "0", "unknown")
+
+    @property
+    def error_active(self) -> bool:
+        """Return True if the device reports an error."""
+        return self.error_code is not None and self.error_code != "00"
+
+    @property
+    def error_text(self) -> str:
+        """Return the human-readable error message."""
+        code = self.error_code or "00"
+        return TESY_ERROR_CODES.get(code, f"Unknown ({code})")
+
+
+def _to_int(data: dict[str, Any], field: str) -> int | None:
+    """Return a field as an integer."""
+    value = data.get(field)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        _LOGGER.warning("Invalid %s value: %s", field, value)
+        return None
+
+
+def _to_float(data: dict[str, Any], field: str) -> float | None:
+    """Return a field as a float."""
+    value = data.get(field)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        _LOGGER.warning("Invalid %s value: %s", field, value)
+        return None
+
+
+def _to_bool(data: dict[str, Any], field: str) -> bool | None:
+    """Return a 0/1 flag as a boolean."""
+    value = data.get(field)
+    if value is None:
+        return None
+    return str(value) == "1"
+
+
+def _to_datetime(data: dict[str, Any], field: str) -> datetime | None:
+    """Return a device date as a UTC datetime."""
+    value = data.get(field)
+    if not value:
+        return None
+    try:
+        # The device reports naive times, assume UTC
+        return dt_util.as_utc(datetime.strptime(value, "%Y-%m-%d %H:%M:%S"))
+    except (ValueError, TypeError):
+        _LOGGER.warning("Invalid %s value: %s", field, value)
+        return None
@@ -13,7 +13,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity import TesyEntity
-from .const import DOMAIN
+from .const import DOMAIN, ATTR_BOOST
 from .coordinator import TesyCoordinator
 
 
@@ -26,24 +26,24 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        [
-            TesySwitch(
-                hass,
-                coordinator,
-                entry,
-                SwitchEntityDescription(
-                    key="boost",
-                    name="Boost",
-                    icon="mdi:rocket-launch-outline",
-                    device_class=SwitchDeviceClass.SWITCH,
-                ),
-                lambda entity: entity.is_boost_mode_on,
-                lambda entity: entity.async_turn_boost_mode_on,
-                lambda entity: entity.async_turn_boost_mode_off,
-            )
-        ]
-    )
+    switches = [
+        TesySwitch(
+            hass,
+            coordinator,
+            entry,
+            SwitchEntityDescription(
+                key="boost",
+                name="Boost",
+                icon="mdi:rocket-launch-outline",
+                device_class=SwitchDeviceClass.SWITCH,
+            ),
+            lambda entity: entity.is_boost_mode_on,
+            lambda entity: entity.async_turn_boost_mode_on,
+            lambda entity: entity.async_turn_boost_mode_off,
+        )
+    ]
+
+    async_add_entities(switch for switch in switches if switch.is_supported())
 
 
 class TesySwitch(TesyEntity, SwitchEntity):
@@ -51,6 +51,7 @@ class TesySwitch(TesyEntity, SwitchEntity):
 
     _attr_has_entity_name = True
     _attr_should_poll = False  # Disable polling, use coordinator updates only
+    _dependent_fields = frozenset({ATTR_BOOST})
 
     def __init__(
         self,
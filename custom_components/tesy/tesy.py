@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from urllib.parse import urlparse, urlencode
-import requests
-import json
+import aiohttp
 
+from .connection import TesyConnectionPool
 from .const import (
     ATTR_POWER,
     ATTR_TARGET_TEMP,
@@ -26,50 +27,54 @@ _LOGGER = logging.getLogger(__name__)
 class Tesy:
     """Tesy instance."""
 
-    def __init__(self, data: dict[str, Any]) -> None:
+    def __init__(self, data: dict[str, Any], pool: TesyConnectionPool) -> None:
         """Init Tesy."""
         self._ip_address = data[IP_ADDRESS]
+        self._pool = pool
 
         self._heater_power = 2400
         if HEATER_POWER in data:
             self._heater_power = data[HEATER_POWER]
 
-    def get_data(self) -> dict[str, Any]:
+    async def get_data(self) -> dict[str, Any]:
         """Get data for Tesy component."""
-        return self._get_request(name="_all").json()
+        return await self._get_request(name="_all")
 
-    def set_target_temperature(self, val: int) -> bool:
+    async def set_target_temperature(self, val: int) -> dict[str, Any]:
         """Set target temperature for Tesy component."""
-        return self._get_request(name=ATTR_TARGET_TEMP, set=val).json()
+        return await self._get_request(name=ATTR_TARGET_TEMP, set=val)
 
-    def set_power(self, val: str) -> bool:
+    async def set_power(self, val: str) -> dict[str, Any]:
         """Set power for Tesy component."""
-        return self._get_request(name=ATTR_POWER, set=val).json()
+        return await self._get_request(name=ATTR_POWER, set=val)
 
-    def set_boost(self, val: str) -> bool:
+    async def set_boost(self, val: str) -> dict[str, Any]:
         """Set boost for Tesy component."""
-        return self._get_request(name=ATTR_BOOST, set=val).json()
+        return await self._get_request(name=ATTR_BOOST, set=val)
 
-    def set_operation_mode(self, val: str) -> bool:
+    async def set_operation_mode(self, val: str) -> dict[str, Any]:
         """Set boost for Tesy component."""
-        return self._get_request(name=ATTR_MODE, set=val).json()
+        return await self._get_request(name=ATTR_MODE, set=val)
 
-    def _get_request(self, **kwargs) -> requests.Response:
+    async def _get_request(self, **kwargs) -> dict[str, Any]:
         """Make GET request to the Tesy API."""
         url = urlparse(f"http://{self._ip_address}/api")
         url = url._replace(query=urlencode(kwargs))
 
         _LOGGER.debug(f"Tesy request: GET {url.geturl()}")
         try:
-            r = requests.get(url.geturl(), timeout=HTTP_TIMEOUT)
-            r.raise_for_status()
-            _LOGGER.debug(f"Tesy status: {r.status_code}")
-            _LOGGER.debug(f"Tesy response: {r.text}")
-
-            return r
+            async with asyncio.timeout(HTTP_TIMEOUT):
+                async with self._pool.session.get(url.geturl()) as r:
+                    r.raise_for_status()
+                    _LOGGER.debug(f"Tesy status: {r.status}")
+                    # The ESP32 does not always send a JSON content type
+                    result = await r.json(content_type=None)
+                    _LOGGER.debug(f"Tesy response: {result}")
+
+                    return result
         except TimeoutError as timeout_error:
             raise ConnectionError from timeout_error
-        except requests.exceptions.ConnectionError as connection_error:
-            raise ConnectionError from connection_error
-        except requests.exceptions.HTTPError as http_error:
+        except aiohttp.ClientResponseError as http_error:
             raise ConnectionError from http_error
+        except aiohttp.ClientError as connection_error:
+            raise ConnectionError from connection_error
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from urllib.parse import urlparse, urlencode
-import requests
+import aiohttp
 
+from .connection import TesyConnectionPool
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,24 +19,40 @@ _LOGGER = logging.getLogger(__name__)
 class TesyOldApi:
     """Tesy Old API instance."""
 
-    def __init__(self, data: dict[str, Any]) -> None:
+    def __init__(self, data: dict[str, Any], pool: TesyConnectionPool) -> None:
         """Init Tesy."""
         self._ip_address = data[IP_ADDRESS]
+        self._pool = pool
 
         self._heater_power = 2400
         if HEATER_POWER in data:
             self._heater_power = data[HEATER_POWER]
 
-    def get_data(self) -> dict[str, Any]:
+        # devstat only carries the device id and MAC address, which never change
+        self._devstat: dict[str, Any] | None = None
+        self._devstat_fetched = 0.0
+
+    async def get_data(self) -> dict[str, Any]:
         """Get data for Tesy component."""
+        status = await self._get_request(cmd="status")
 
         return self.convertApi(
             {
-                "status": self._get_request(cmd="status").json(),
-                "devstat": self._get_request(cmd="devstat").json(),
+                "status": status,
+                "devstat": await self._get_devstat(),
             }
         )
 
+    async def _get_devstat(self) -> dict[str, Any]:
+        """Return devstat, fetched once and then again after DEVSTAT_TTL."""
+        if (
+            self._devstat is None
+            or time.monotonic() - self._devstat_fetched >= DEVSTAT_TTL
+        ):
+            self._devstat = await self._get_request(cmd="devstat")
+            self._devstat_fetched = time.monotonic()
+        return self._devstat
+
     def convertApi(self, data: dict[str, Any]) -> dict[str, Any]:
         onoff = {"on": "1", "off": "0"}
 
@@ -55,11 +74,11 @@ class TesyOldApi:
         _LOGGER.debug(f"converted API: {str(o)}")
         return o
 
-    def set_target_temperature(self, val: int) -> bool:
+    async def set_target_temperature(self, val: int) -> dict[str, Any]:
         """Set target temperature for Tesy component."""
-        return self._get_request("setTemp", val=val).json()
+        return await self._get_request("setTemp", val=val)
 
-    def set_power(self, val: str) -> bool:
+    async def set_power(self, val: str) -> dict[str, Any]:
         """Set power for Tesy component."""
         if val == "0":
             _val = "off"
@@ -67,32 +86,39 @@ class TesyOldApi:
             _val = "on"
         else:
             raise ValueError
-        return self._get_request("power", val=_val).json()
+        return await self._get_request("power", val=_val)
 
-    def set_boost(self, val: str) -> bool:
+    async def set_boost(self, val: str) -> dict[str, Any]:
         """Set boost for Tesy component."""
-        return self._get_request("boostSW", mode=val).json()
+        return await self._get_request("boostSW", mode=val)
 
-    def set_operation_mode(self, val: str) -> bool:
+    async def set_operation_mode(self, val: str) -> dict[str, Any]:
         """Set mode for Tesy component."""
-        return self._get_request("modeSW", mode=int(val) + 1).json()
+        return await self._get_request("modeSW", mode=int(val) + 1)
 
-    def _get_request(self, cmd, **kwargs) -> requests.Response:
+    async def _get_request(self, cmd, **kwargs) -> dict[str, Any]:
         """Make GET request to the Tesy API."""
         url = urlparse(f"http://{self._ip_address}/{cmd}")
         url = url._replace(query=urlencode(kwargs))
 
         _LOGGER.debug(f"Tesy request: GET {url.geturl()}")
         try:
-            r = requests.get(url.geturl(), timeout=HTTP_TIMEOUT)
-            r.raise_for_status()
-            _LOGGER.debug(f"Tesy status: {r.status_code}")
-            _LOGGER.debug(f"Tesy response: {r.text}")
-
-            return r
+            async with asyncio.timeout(HTTP_TIMEOUT):
+                async with self._pool.session.get(url.geturl()) as r:
+                    r.raise_for_status()
+                    _LOGGER.debug(f"Tesy status: {r.status}")
+                    # Atheros firmware answers with a text/html content type
+                    result = await r.json(content_type=None)
+                    _LOGGER.debug(f"Tesy response: {result}")
+
+                    return result
         except TimeoutError as timeout_error:
+            # The module may reboot while unreachable, re-read devstat afterwards
+            self._devstat = None
             raise ConnectionError from timeout_error
-        except requests.exceptions.ConnectionError as connection_error:
-            raise ConnectionError from connection_error
-        except requests.exceptions.HTTPError as http_error:
+        except aiohttp.ClientResponseError as http_error:
+            self._devstat = None
             raise ConnectionError from http_error
+        except aiohttp.ClientError as connection_error:
+            self._devstat = None
+            raise ConnectionError from connection_error
@@ -25,7 +25,6 @@ from .const import (
     TESY_DEVICE_TYPES,
     ATTR_CURRENT_TEMP,
     ATTR_DEVICE_ID,
-    ATTR_MAX_SHOWERS,
     ATTR_IS_HEATING,
     ATTR_MODE,
     ATTR_POWER,
@@ -36,8 +35,6 @@ from .const import (
     ATTR_POSITION,
     ATTR_COUNTDOWN,
     ATTR_ERROR,
-    ATTR_UPTIME,
-    ATTR_RSSI,
     DOMAIN,
     TESY_MODE_P1,
     TESY_MODE_P2,
@@ -61,6 +58,16 @@ OPERATION_LIST = [
     TESY_MODE_EC3,
 ]
 
+OPERATION_MODE_CODES = {
+    STATE_PERFORMANCE: "0",
+    TESY_MODE_P1: "1",
+    TESY_MODE_P2: "2",
+    TESY_MODE_P3: "3",
+    STATE_ECO: "4",
+    TESY_MODE_EC2: "5",
+    TESY_MODE_EC3: "6",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -96,6 +103,29 @@ class TesyWaterHeater(TesyEntity, WaterHeaterEntity):
         | WaterHeaterEntityFeature.ON_OFF
     )
     _attr_should_poll = False  # Disable polling, use coordinator updates only
+    _unrecorded_attributes = TesyEntity._unrecorded_attributes | frozenset(
+        {
+            "target_temp_step",
+            "countdown_timer_minutes",
+            "countdown_timer_seconds",
+            "time_to_target_temperature",
+        }
+    )
+    _dependent_fields = frozenset(
+        {
+            ATTR_CURRENT_TEMP,
+            ATTR_TARGET_TEMP,
+            ATTR_CURRENT_TARGET_TEMP,
+            ATTR_POWER,
+            ATTR_MODE,
+            ATTR_IS_HEATING,
+            ATTR_CHILD_LOCK,
+            ATTR_VACATION,
+            ATTR_POSITION,
+            ATTR_COUNTDOWN,
+            ATTR_ERROR,
+        }
+    )
 
     def __init__(
         self,
@@ -127,20 +157,13 @@ class TesyWaterHeater(TesyEntity, WaterHeaterEntity):
                 ]
                 == True
             ):
-                if ATTR_MAX_SHOWERS in self.coordinator.data:
-                    tmp_max = self.coordinator.data[ATTR_MAX_SHOWERS]
-                    _LOGGER.debug("tmpMX value from device: %s (type: %s)", tmp_max, type(tmp_max))
-                    try:
-                        # Handle tmpMX being either string or integer
-                        if tmp_max is not None:
-                            self._attr_max_temp = int(tmp_max)
-                            _LOGGER.debug("Set max_temp to: %s for shower-based device", self._attr_max_temp)
-                    except (ValueError, TypeError) as e:
-                        # If conversion fails, keep the default from device type
-                        _LOGGER.warning("Failed to convert tmpMX value '%s' to integer: %s. Using default: %s", 
-                                       tmp_max, e, self._attr_max_temp)
+                max_step = self.coordinator.snapshot.max_step
+                if max_step is not None:
+                    self._attr_max_temp = max_step
+                    _LOGGER.debug("Set max_temp to: %s for shower-based device", self._attr_max_temp)
                 else:
-                    _LOGGER.debug("tmpMX not found in device data for shower-based device. Using default: %s", 
+                    # Missing or invalid tmpMX, keep the default from device type
+                    _LOGGER.debug("No valid tmpMX for shower-based device. Using default: %s",
                                  self._attr_max_temp)
         _LOGGER.debug(
             "Initialized TesyWaterHeater: min_temp=%s, max_temp=%s",
@@ -151,23 +174,18 @@ class TesyWaterHeater(TesyEntity, WaterHeaterEntity):
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return float(self.coordinator.data[ATTR_CURRENT_TEMP])
+        return self.coordinator.snapshot.current_temp
 
     @property
     def current_operation(self):
         """Return current operation."""
 
-        if (
-            ATTR_POWER not in self.coordinator.data
-            or ATTR_MODE not in self.coordinator.data
-        ):
+        snapshot = self.coordinator.snapshot
+        # if powered off or missing from json
+        if not snapshot.power or snapshot.mode_code is None:
             return STATE_OFF
 
-        # if powered off
-        if self.coordinator.data[ATTR_POWER] != "1":
-            return STATE_OFF
-
-        mode = self.coordinator.data[ATTR_MODE]
+        mode = snapshot.mode_code
 
         if mode == "0":
             return STATE_PERFORMANCE
@@ -193,12 +211,15 @@ class TesyWaterHeater(TesyEntity, WaterHeaterEntity):
         if ATTR_POWER not in self.coordinator.data:
             return
 
-        if self.coordinator.data[ATTR_POWER] == "1":
-            if self.coordinator.data[ATTR_MODE] != STATE_PERFORMANCE:
-                await self.coordinator.async_set_operation_mode("0")
+        # Setpoint is only used in manual mode, switch to it if powered on
+        mode = None
+        if self.coordinator.snapshot.power:
+            mode = OPERATION_MODE_CODES[STATE_PERFORMANCE]
 
-        await self.coordinator.async_set_target_temperature(
-            kwargs.get(ATTR_TEMPERATURE)
+        await self.coordinator.async_apply_state(
+            mode=mode,
+            target_temperature=kwargs.get(ATTR_TEMPERATURE),
+            debounce=True,
         )
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
@@ -209,27 +230,11 @@ class TesyWaterHeater(TesyEntity, WaterHeaterEntity):
             return
 
         if operation_mode == STATE_OFF:
-            await self.coordinator.async_set_power("0")
+            await self.coordinator.async_apply_state(power="0")
         else:
-            if self.coordinator.data[ATTR_POWER] == "0":
-                await self.coordinator.async_set_power("1")
-
-            if operation_mode == STATE_PERFORMANCE:
-                new_mode = "0"
-            if operation_mode == TESY_MODE_P1:
-                new_mode = "1"
-            if operation_mode == TESY_MODE_P2:
-                new_mode = "2"
-            if operation_mode == TESY_MODE_P3:
-                new_mode = "3"
-            if operation_mode == STATE_ECO:
-                new_mode = "4"
-            if operation_mode == TESY_MODE_EC2:
-                new_mode = "4"
-            if operation_mode == TESY_MODE_EC3:
-                new_mode = "6"
-
-            await self.coordinator.async_set_operation_mode(new_mode)
+            await self.coordinator.async_apply_state(
+                power="1", mode=OPERATION_MODE_CODES[operation_mode]
+            )
 
     async def turn_on(self, **_kwargs: Any) -> None:
         """Turn on water heater."""
@@ -243,78 +248,43 @@ class TesyWaterHeater(TesyEntity, WaterHeaterEntity):
     def target_temperature(self):
         """Return the target temperature."""
         # Return setpoint do
-        return float(self.coordinator.data[ATTR_TARGET_TEMP])
+        return self.coordinator.snapshot.target_temp
 
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return the state attributes."""
+        snapshot = self.coordinator.snapshot
         attributes = {
-            "is_heating": ATTR_IS_HEATING in self.coordinator.data
-            and self.coordinator.data[ATTR_IS_HEATING] == "1",
+            "is_heating": bool(snapshot.heating),
             "target_temp_step": 1,
         }
 
         # Add current target temperature (what the controller is actually using)
-        if ATTR_CURRENT_TARGET_TEMP in self.coordinator.data:
-            attributes["current_target_temperature"] = float(
-                self.coordinator.data[ATTR_CURRENT_TARGET_TEMP]
-            )
+        if snapshot.requested_temp is not None:
+            attributes["current_target_temperature"] = snapshot.requested_temp
 
         # Add child lock status
-        if ATTR_CHILD_LOCK in self.coordinator.data:
-            attributes["child_lock"] = self.coordinator.data[ATTR_CHILD_LOCK] == "1"
+        if snapshot.child_lock is not None:
+            attributes["child_lock"] = snapshot.child_lock
 
         # Add vacation mode status
-        if ATTR_VACATION in self.coordinator.data:
-            attributes["vacation_mode"] = self.coordinator.data[ATTR_VACATION] == "1"
+        if snapshot.vacation is not None:
+            attributes["vacation_mode"] = snapshot.vacation
 
         # Add position (vertical/horizontal)
-        if ATTR_POSITION in self.coordinator.data:
-            position_value = self.coordinator.data[ATTR_POSITION]
-            attributes["position"] = (
-                "Vertical" if position_value == "0" else "Horizontal"
-            )
+        if snapshot.position is not None:
+            attributes["position"] = snapshot.position
 
         # Add countdown timer
-        if ATTR_COUNTDOWN in self.coordinator.data:
-            countdown_minutes = int(self.coordinator.data[ATTR_COUNTDOWN])
-            if countdown_minutes > 0:
-                attributes["countdown_timer_minutes"] = countdown_minutes
-                attributes["countdown_timer_seconds"] = countdown_minutes * 60
-                attributes["time_to_target_temperature"] = f"{countdown_minutes} minutes"
+        countdown_minutes = snapshot.countdown
+        if countdown_minutes is not None and countdown_minutes > 0:
+            attributes["countdown_timer_minutes"] = countdown_minutes
+            attributes["countdown_timer_seconds"] = countdown_minutes * 60
+            attributes["time_to_target_temperature"] = f"{countdown_minutes} minutes"
 
         # Add error status
-        if ATTR_ERROR in self.coordinator.data:
-            error_code = self.coordinator.data[ATTR_ERROR]
-            attributes["error_code"] = error_code
-            attributes["has_error"] = error_code != "00"
-
-        # Add uptime information
-        if ATTR_UPTIME in self.coordinator.data:
-            uptime_seconds = int(self.coordinator.data[ATTR_UPTIME])
-            uptime_hours = uptime_seconds // 3600
-            uptime_days = uptime_hours // 24
-            attributes["uptime_seconds"] = uptime_seconds
-            attributes["uptime_hours"] = uptime_hours
-            attributes["uptime_days"] = uptime_days
-
-        # Add WiFi signal strength
-        if ATTR_RSSI in self.coordinator.data:
-            rssi = int(self.coordinator.data[ATTR_RSSI])
-            attributes["wifi_signal_dbm"] = rssi
-            # Convert to quality percentage (rough approximation)
-            if rssi >= -50:
-                signal_quality = 100
-            elif rssi >= -60:
-                signal_quality = 80
-            elif rssi >= -70:
-                signal_quality = 60
-            elif rssi >= -80:
-                signal_quality = 40
-            elif rssi >= -90:
-                signal_quality = 20
-            else:
-                signal_quality = 0
-            attributes["wifi_signal_quality"] = f"{signal_quality}%"
+        if snapshot.error_code is not None:
+            attributes["error_code"] = snapshot.error_code
+            attributes["has_error"] = snapshot.error_active
 
         return attributes